@@ -0,0 +1,69 @@
+// Avatar sprite sheet coordinates, generated by generate_avatar_atlas.py - do not edit
+const avatarAtlas = {
+  "width": 416,
+  "height": 332,
+  "sheets": {
+    "avif": {
+      "1x": "avatar_atlas/avatars@1x.avif",
+      "2x": "avatar_atlas/avatars@2x.avif"
+    },
+    "webp": {
+      "1x": "avatar_atlas/avatars@1x.webp",
+      "2x": "avatar_atlas/avatars@2x.webp"
+    }
+  },
+  "speakers": {
+    "hassan-sirelkhatim": {
+      "x": 250,
+      "y": 2,
+      "size": 100
+    },
+    "peter-coveney": {
+      "x": 250,
+      "y": 106,
+      "size": 100
+    },
+    "james-gin": {
+      "x": 2,
+      "y": 126,
+      "size": 100
+    },
+    "francesco-ferroni": {
+      "x": 106,
+      "y": 126,
+      "size": 100
+    },
+    "steven-kench": {
+      "x": 210,
+      "y": 210,
+      "size": 100
+    },
+    "sina-samangooei": {
+      "x": 314,
+      "y": 210,
+      "size": 100
+    },
+    "lei-ge": {
+      "x": 2,
+      "y": 230,
+      "size": 100
+    },
+    "ronan-docherty": {
+      "x": 106,
+      "y": 230,
+      "size": 100
+    }
+  },
+  "organizers": {
+    "lei-ge": {
+      "x": 2,
+      "y": 2,
+      "size": 120
+    },
+    "samuel-cooper": {
+      "x": 126,
+      "y": 2,
+      "size": 120
+    }
+  }
+};
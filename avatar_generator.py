@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Shared circular avatar generator behind the speaker and organizer avatar scripts for Deep Matters: Foundations.
+generate_speaker_avatars.py and generate_organizer_avatars.py only pick a roster, an
+output directory and the avatar size and colors. Compositing, build-cache checks,
+the decode/render/write pipeline and the summary all live here.
+"""
+
+import argparse
+from pathlib import Path
+
+import masks
+import photo_utils
+from batch import add_jobs_argument, print_failure_summary
+from build_cache import (add_cache_arguments, find_stale_outputs, is_fresh, load_manifest,
+                         output_key, report_stale, save_manifest)
+from encoding import (add_encoding_arguments, encoding_settings, format_stats, output_suffix,
+                      print_encoding_summary, save_image, settings_from_args)
+from masks import composite_shaped_photo
+from memory import estimate_cost, print_peak_memory
+from photo_utils import add_crop_cache_arguments, configure_crop_cache, load_square_photo, photo_at
+from pipeline import add_pipeline_arguments, run_stages
+from roster import load_organizers, load_speakers
+from tracing import add_profile_argument, finish_profile, span, start_profile
+
+# Roster loader for each generator's ROSTER
+ROSTER_LOADERS = {
+    "speakers": load_speakers,
+    "organizers": load_organizers,
+}
+
+
+def create_circular_avatar(image_path, size=400, border_width=8, border_color="#fab22b"):
+    """Create a circular avatar with border from an image path, a pre-cropped square photo or a PhotoPyramid."""
+    # Calculate inner size (accounting for border)
+    inner_size = size - (border_width * 2)
+
+    # Open, convert and crop to square from center and resize to inner size (a pre-cropped
+    # photo or pyramid skips the decode; JPEGs decode at the smallest draft scale that covers it)
+    img = photo_at(image_path, inner_size)
+
+    # Border circle and masked photo, composited straight into one RGBA output
+    with span("composite"):
+        output = composite_shaped_photo(img, "circle", border_width, border_color)
+
+    return output
+
+
+def save_avatar(image_path, output_file, size, border_width, border_color, settings=None):
+    """Render one avatar and write it to disk (runs inside a worker process with --jobs).
+
+    Returns (encode seconds, bytes written).
+    """
+    with span("render", subject=Path(output_file).stem):
+        avatar = create_circular_avatar(image_path, size=size, border_width=border_width, border_color=border_color)
+        return save_image(avatar, output_file, settings or encoding_settings())
+
+
+def load_avatar_photo(image_path, output_file, size, border_width, border_color, settings):
+    """Pipeline prefetch stage: decode and crop the photo for one save_avatar task."""
+    return load_square_photo(image_path, min_size=size - 2 * border_width)
+
+
+def render_avatar(task, photo, load_error):
+    """Pipeline render stage for one save_avatar task."""
+    if load_error is not None:
+        raise load_error
+    _, _, size, border_width, border_color, _ = task
+    return create_circular_avatar(photo, size=size, border_width=border_width, border_color=border_color)
+
+
+def write_avatar(task, avatar):
+    """Pipeline write stage for one save_avatar task."""
+    return save_image(avatar, task[1], task[5] or encoding_settings())
+
+
+def estimate_avatar_cost(image_path, output_file, size, border_width, border_color, settings):
+    """Estimated peak bytes of one save_avatar task, from the photo's header (for --max-memory)."""
+    return estimate_cost(image_path, size - 2 * border_width, [(size, size)])
+
+
+def run_avatar_tasks(tasks, args):
+    """Run save_avatar tasks on worker processes (--jobs) or through the threaded pipeline."""
+    return run_stages(tasks, args, save_avatar, load_avatar_photo, render_avatar, write_avatar,
+                      subject=lambda task: Path(task[1]).stem, cost=estimate_avatar_cost)
+
+
+def render_inputs(person):
+    """Files an avatar's pixels depend on, for the incremental build cache."""
+    return [person["image"], __file__, photo_utils.__file__, masks.__file__]
+
+
+def main(generator, argv=None):
+    """Generate one circular avatar per person for an avatar script.
+
+    generator is the script's module: its ROSTER, OUTPUT_DIR, OUTPUT_SUFFIX, AVATAR_SIZE,
+    BORDER_WIDTH and COLOR_ACCENT choose the avatars, and its file and constants are part
+    of every output's cache key.
+    """
+    parser = argparse.ArgumentParser(description=f"Generate circular {generator.ROSTER[:-1]} avatars.")
+    add_cache_arguments(parser)
+    add_crop_cache_arguments(parser)
+    add_jobs_argument(parser)
+    add_pipeline_arguments(parser)
+    add_profile_argument(parser)
+    add_encoding_arguments(parser)
+    args = parser.parse_args(argv)
+    start_profile(args)
+    configure_crop_cache(args)
+    settings = settings_from_args(parser, args)
+    suffix = output_suffix(generator.OUTPUT_SUFFIX, settings)
+    people = ROSTER_LOADERS[generator.ROSTER]()
+    size = generator.AVATAR_SIZE
+
+    # Create output directory
+    output_path = Path(generator.OUTPUT_DIR)
+    output_path.mkdir(exist_ok=True)
+
+    print(f"Generating circular avatars for {len(people)} {generator.ROSTER}...")
+    print(f"Output directory: {output_path.absolute()}")
+    print(f"Avatar size: {size}x{size} pixels\n")
+
+    manifest = load_manifest()
+    pending = []
+    skipped = 0
+    for person_id, person in people.items():
+        output_file = output_path / f"{person_id}{suffix}"
+        key = output_key(generator, person, generator.render_inputs(person), settings)
+        if not args.force and is_fresh(manifest, output_file, key):
+            skipped += 1
+        else:
+            pending.append((person_id, person, output_file, key))
+
+    tasks = [(person["image"], str(output_file), size, generator.BORDER_WIDTH, generator.COLOR_ACCENT, settings)
+             for _, person, output_file, _ in pending]
+    generated = 0
+    failures = []
+    all_stats = []
+    for (person_id, person, output_file, key), (stats, error) in zip(pending, run_avatar_tasks(tasks, args)):
+        if error is None:
+            manifest[str(output_file)] = key
+            generated += 1
+            all_stats.append(stats)
+            print(f"✓ Generated: {output_file.name} - {person['name']} {format_stats(stats)}")
+        else:
+            failures.append((person_id, error))
+
+    expected = [f"{person_id}{suffix}" for person_id in people]
+    report_stale(find_stale_outputs(output_path, suffix, expected), manifest, prune=args.prune)
+    save_manifest(manifest)
+
+    print_encoding_summary(all_stats, settings)
+    print_failure_summary(failures)
+    print(f"\nDone! Generated {generated} circular avatars in {generator.OUTPUT_DIR}/ ({skipped} unchanged, skipped)")
+    print("All avatars have transparent backgrounds and can be used on any background color.")
+
+    print_peak_memory(args)
+    finish_profile(args)
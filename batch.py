@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Batch execution helpers shared by the Deep Matters image generators.
+Renders run serially or over a process pool (--jobs N); results always come
+back in roster order and failures are collected into a single summary.
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import tracing
+from memory import MemoryBudget
+from photo_utils import CROP_CACHE, with_crop_cache
+
+
+def add_jobs_argument(parser):
+    """Add the shared --jobs option to a generator's argument parser."""
+    parser.add_argument("-j", "--jobs", type=int, default=1, metavar="N",
+                        help="render on N worker processes (0 = one per CPU core, default: 1)")
+
+
+def resolve_jobs(jobs):
+    """Turn a --jobs value into a worker count (0 means every core)."""
+    if jobs == 0:
+        return os.cpu_count() or 1
+    return max(1, jobs)
+
+
+def run_tasks(func, tasks, jobs=1, costs=None, max_memory=None):
+    """Run func(*task) for every task, yielding (result, error) pairs in task order.
+
+    func must be a module-level function so it can be sent to worker processes.
+    With costs (estimated bytes per task) and max_memory, a task is only handed to
+    the pool while the estimates of the tasks in flight fit in max_memory.
+    With --profile, spans recorded in the workers are merged into this process's trace.
+    Each task is sent with this process's crop cache options, which workers started
+    with spawn (the macOS default) would not otherwise see.
+    """
+    jobs = resolve_jobs(jobs)
+    if jobs == 1 or len(tasks) <= 1:
+        for task in tasks:
+            try:
+                yield func(*task), None
+            except Exception as e:
+                yield None, e
+        return
+
+    func = partial(with_crop_cache, dict(CROP_CACHE), func)
+    costs = costs or [0] * len(tasks)
+    budget = MemoryBudget(max_memory)
+    with ProcessPoolExecutor(max_workers=min(jobs, len(tasks))) as pool:
+        in_flight = deque()
+
+        def finished():
+            future, cost = in_flight.popleft()
+            try:
+                result = future.result()
+                if tracing.ENABLED:
+                    result, events = result
+                    tracing.EVENTS.extend(events)
+                return result, None
+            except Exception as e:
+                return None, e
+            finally:
+                budget.release(cost)
+
+        for task, cost in zip(tasks, costs):
+            # Wait for the oldest tasks until this one fits the memory budget
+            while not budget.fits(cost):
+                yield finished()
+            if tracing.ENABLED:
+                in_flight.append((pool.submit(tracing.collect, func, *task), cost))
+            else:
+                in_flight.append((pool.submit(func, *task), cost))
+            budget.acquire(cost)
+        while in_flight:
+            yield finished()
+
+
+def print_failure_summary(failures):
+    """Print every (name, error) failure collected during a batch."""
+    if not failures:
+        return
+    print(f"\n✗ {len(failures)} failed:")
+    for name, error in failures:
+        print(f"  ✗ {name}: {error}")
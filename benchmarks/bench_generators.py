@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Benchmark the Deep Matters image generators on synthetic rosters.
+
+Builds rosters of 10, 100 and 1,000 speakers whose photos are synthetic JPEGs at
+several source resolutions (0.3 MP up to 24 MP), then times each hot path per
+speaker: photo decode, create_circular_avatar, the landscape and square
+generate_speaker_image, and the save step. Every (roster size, resolution) case
+runs in a fresh process so its peak RSS is its own.
+
+Results are written as JSON (per-stage medians, cards/sec, peak RSS, plus the git
+commit and library versions) so runs on different commits can be compared:
+
+    python benchmarks/bench_generators.py --output before.json
+    ... change something ...
+    python benchmarks/bench_generators.py --output after.json --compare before.json
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+import PIL
+from PIL import Image
+
+# Bump when the JSON layout or the measured stages change, so old results are not compared blindly
+SCHEMA_VERSION = 2
+
+# Default matrix
+ROSTER_SIZES = (10, 100, 1000)
+RESOLUTIONS = {
+    "0.3mp": (640, 480),
+    "2mp": (1600, 1200),
+    "12mp": (4000, 3000),
+    "24mp": (6000, 4000),
+}
+SOURCE_QUALITY = 90
+
+# Per-speaker stages, in the order they run
+STAGES = ("decode", "avatar", "landscape", "square", "save")
+
+AFFILIATIONS = ("Imperial College London", "Polaron", "University of Cambridge",
+                "Max Planck Institute for Polymer Research", "ETH Zürich")
+
+
+def synthetic_photo(size):
+    """Deterministic, detailed synthetic RGB photo (mandelbrot + gradients) of the given size."""
+    width, height = size
+    detail = Image.effect_mandelbrot((width, height), (-2.2, -1.2, 0.8, 1.2), 64)
+    horizontal = Image.linear_gradient("L").rotate(90).resize((width, height))
+    radial = Image.radial_gradient("L").resize((width, height))
+    return Image.merge("RGB", (detail, horizontal, radial))
+
+
+def make_source_photo(path, size):
+    """Write a synthetic_photo of the given size as a JPEG."""
+    synthetic_photo(size).save(path, "JPEG", quality=SOURCE_QUALITY)
+
+
+def synthetic_roster(count, photo_dir):
+    """Roster of count speakers, each with its own photo in photo_dir, with distinct names and mixed affiliations."""
+    roster = {}
+    for i in range(count):
+        affiliation = AFFILIATIONS[i % len(AFFILIATIONS)]
+        roster[f"speaker-{i:04d}"] = {
+            "name": f"Speaker {i:04d} Benchmark",
+            "affiliation": affiliation,
+            "image": str(Path(photo_dir) / f"speaker-{i:04d}.jpg"),
+            "logo": "images/polaron-logo.png" if affiliation == "Polaron" else None,
+        }
+    return roster
+
+
+def write_speaker_photo(source, person_id, path):
+    """Write the source JPEG with a per-speaker comment, so every speaker's photo has its own content hash."""
+    comment = person_id.encode("ascii")
+    segment = b"\xff\xfe" + (len(comment) + 2).to_bytes(2, "big") + comment
+    Path(path).write_bytes(source[:2] + segment + source[2:])
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB (ru_maxrss is KB on Linux, bytes on macOS)."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_case(count, image_path, output_dir, encoding_profile):
+    """Render a synthetic roster and return per-stage timings (runs in its own process).
+
+    The crop cache is off, so every speaker's decode is measured from its own JPEG and
+    nothing is written to the repository's .build_cache/crops.
+    """
+    os.chdir(REPO_ROOT)
+    import generate_linkedin_images as landscape
+    import generate_linkedin_images_square as square
+    import generate_speaker_avatars as speaker_avatars
+    from encoding import encoding_settings, save_image
+    from photo_utils import CROP_CACHE, load_square_photo
+
+    CROP_CACHE["enabled"] = False
+    settings = encoding_settings(encoding_profile)
+    avatar_photo_size = speaker_avatars.AVATAR_SIZE - 2 * speaker_avatars.BORDER_WIDTH
+    min_size = max(avatar_photo_size, landscape.PHOTO_SIZE, square.PHOTO_SIZE)
+    timings = {stage: [] for stage in STAGES}
+
+    source = Path(image_path).read_bytes()
+    wall = 0.0
+    for person_id, person in synthetic_roster(count, output_dir).items():
+        # Each photo exists only while its speaker renders, so 1,000 speakers need no extra disk
+        write_speaker_photo(source, person_id, person["image"])
+        t0 = time.perf_counter()
+        photo = load_square_photo(person["image"], min_size=min_size)
+        t1 = time.perf_counter()
+        avatar = speaker_avatars.create_circular_avatar(
+            photo,
+            size=speaker_avatars.AVATAR_SIZE,
+            border_width=speaker_avatars.BORDER_WIDTH,
+            border_color=speaker_avatars.COLOR_ACCENT
+        )
+        t2 = time.perf_counter()
+        landscape_card = landscape.generate_speaker_image(person_id, person, photo=photo)
+        t3 = time.perf_counter()
+        square_card = square.generate_speaker_image(person_id, person, photo=photo)
+        t4 = time.perf_counter()
+        for name, img in (("avatar", avatar), ("linkedin", landscape_card), ("square", square_card)):
+            save_image(img, Path(output_dir) / f"{person_id}-{name}.png", settings)
+        t5 = time.perf_counter()
+        wall += t5 - t0
+        Path(person["image"]).unlink()
+
+        for stage, seconds in zip(STAGES, (t1 - t0, t2 - t1, t3 - t2, t4 - t3, t5 - t4)):
+            timings[stage].append(seconds)
+    return {"wall_seconds": wall, "timings": timings, "peak_rss_mb": peak_rss_mb()}
+
+
+def summarize(count, resolution, size, result):
+    """JSON-ready summary of one case: medians in ms, throughput and peak RSS."""
+    wall = result["wall_seconds"]
+    return {
+        "speakers": count,
+        "resolution": resolution,
+        "source_size": list(size),
+        "median_ms": {stage: round(statistics.median(values) * 1000, 3)
+                      for stage, values in result["timings"].items()},
+        "total_ms": {stage: round(sum(values) * 1000, 1) for stage, values in result["timings"].items()},
+        "wall_seconds": round(wall, 3),
+        "cards_per_second": round(count * 3 / wall, 2),
+        "speakers_per_second": round(count / wall, 2),
+        "peak_rss_mb": round(result["peak_rss_mb"], 1),
+    }
+
+
+def git_commit():
+    """Current commit hash (with '-dirty' for uncommitted changes), or None outside a git checkout."""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], cwd=REPO_ROOT, capture_output=True,
+                                text=True, check=True).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=REPO_ROOT,
+                               capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return commit + ("-dirty" if dirty else "")
+
+
+def environment():
+    return {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "pillow": PIL.__version__,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def print_case(case):
+    medians = "  ".join(f"{stage} {case['median_ms'][stage]:.1f}" for stage in STAGES)
+    print(f"✓ {case['speakers']:>5} speakers @ {case['resolution']:>5}: "
+          f"{case['cards_per_second']:.1f} cards/s, peak {case['peak_rss_mb']:.0f} MB | median ms: {medians}",
+          file=sys.stderr)
+
+
+def compare_results(baseline, current):
+    """Print per-case throughput and median changes against an earlier results file."""
+    if baseline.get("schema") != current["schema"]:
+        print(f"✗ Cannot compare: baseline schema {baseline.get('schema')} != {current['schema']}",
+              file=sys.stderr)
+        return
+    old_cases = {(case["speakers"], case["resolution"]): case for case in baseline["cases"]}
+    print(f"\nCompared with {baseline['environment'].get('commit')}:", file=sys.stderr)
+    for case in current["cases"]:
+        old = old_cases.get((case["speakers"], case["resolution"]))
+        if old is None:
+            continue
+        changes = "  ".join(f"{stage} {case['median_ms'][stage] / old['median_ms'][stage]:.2f}x"
+                            for stage in STAGES if old["median_ms"][stage])
+        speedup = case["cards_per_second"] / old["cards_per_second"]
+        print(f"  {case['speakers']:>5} @ {case['resolution']:>5}: throughput {speedup:.2f}x | "
+              f"median time {changes}", file=sys.stderr)
+
+
+def parse_list(text, choices=None):
+    items = [item.strip() for item in text.split(",") if item.strip()]
+    if choices is not None:
+        unknown = [item for item in items if item not in choices]
+        if unknown:
+            raise argparse.ArgumentTypeError(f"unknown value(s): {', '.join(unknown)}")
+    return items
+
+
+def main(argv=None):
+    from encoding import DEFAULT_PROFILE, PROFILES
+
+    parser = argparse.ArgumentParser(description="Benchmark the image generators on synthetic rosters.")
+    parser.add_argument("--speakers", type=lambda text: [int(n) for n in parse_list(text)],
+                        default=list(ROSTER_SIZES), help="comma-separated roster sizes (default: 10,100,1000)")
+    parser.add_argument("--resolutions", type=lambda text: parse_list(text, RESOLUTIONS),
+                        default=list(RESOLUTIONS),
+                        help=f"comma-separated source resolutions from {', '.join(RESOLUTIONS)} (default: all)")
+    parser.add_argument("--quick", action="store_true", help="only 10 speakers at 0.3mp and 12mp (smoke run)")
+    parser.add_argument("--encoding", choices=sorted(PROFILES), default=DEFAULT_PROFILE,
+                        help=f"encoding profile for the save step (default: {DEFAULT_PROFILE})")
+    parser.add_argument("--output", help="write JSON results here (default: stdout)")
+    parser.add_argument("--compare", metavar="BASELINE_JSON", help="print changes against an earlier results file")
+    args = parser.parse_args(argv)
+    if args.quick:
+        args.speakers, args.resolutions = [10], ["0.3mp", "12mp"]
+
+    results = {"schema": SCHEMA_VERSION, "environment": environment(), "encoding": args.encoding, "cases": []}
+    # spawn, so every case starts from a fresh interpreter and reports its own peak RSS
+    context = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory(prefix="deep-matters-bench-") as tmp:
+        for resolution in args.resolutions:
+            size = RESOLUTIONS[resolution]
+            image_path = Path(tmp) / f"source-{resolution}.jpg"
+            make_source_photo(image_path, size)
+            for count in args.speakers:
+                output_dir = Path(tmp) / f"out-{resolution}-{count}"
+                output_dir.mkdir()
+                with context.Pool(1) as pool:
+                    result = pool.apply(run_case, (count, str(image_path), str(output_dir), args.encoding))
+                case = summarize(count, resolution, size, result)
+                results["cases"].append(case)
+                print_case(case)
+
+    text = json.dumps(results, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+        print(f"\nResults written to {args.output}", file=sys.stderr)
+    else:
+        print(text)
+
+    if args.compare:
+        compare_results(json.loads(Path(args.compare).read_text(encoding="utf-8")), results)
+
+
+if __name__ == "__main__":
+    main()
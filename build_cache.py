@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Content-addressed incremental build cache for the Deep Matters image generators.
+Each output is keyed on a hash of everything its pixels depend on (source photo,
+logos, fonts, generator code and layout constants, roster fields); outputs whose
+key is unchanged are skipped, and outputs no longer in the roster are reported.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from roster import CACHE_DIR  # Shared with the roster cache, so both live in one directory
+
+# Configuration
+MANIFEST_FILE = "build-manifest.json"
+
+# Roster fields that end up in rendered images (a generator can narrow this with CACHE_FIELDS)
+PERSON_FIELDS = ("name", "affiliation", "image", "logo")
+
+_digest_memo = {}
+
+
+def file_mtime(path):
+    """A file's mtime in nanoseconds, or None if it is missing (for in-process cache keys)."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def file_digest(path):
+    """SHA-256 of a file's bytes, memoized per (path, mtime, size). Missing files hash to 'missing'."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return "missing"
+    memo_key = (str(path), stat.st_mtime_ns, stat.st_size)
+    if memo_key not in _digest_memo:
+        _digest_memo[memo_key] = hashlib.sha256(Path(path).read_bytes()).hexdigest()
+    return _digest_memo[memo_key]
+
+
+def module_constants(module):
+    """Collect a generator's UPPER_CASE scalar settings (sizes, colors, conference text)."""
+    return {
+        name: value for name, value in vars(module).items()
+        if name.isupper() and isinstance(value, (str, int, float, bool))
+    }
+
+
+def output_key(module, person, files, settings=None):
+    """Hash the generator module, its constants, the person's fields, every input file and run settings."""
+    payload = {
+        "settings": settings,
+        "module": file_digest(module.__file__),
+        "constants": module_constants(module),
+        "fields": {field: person.get(field) for field in getattr(module, "CACHE_FIELDS", PERSON_FIELDS)},
+        "files": {os.path.relpath(path): file_digest(path) for path in files if path},
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def load_manifest(cache_dir=CACHE_DIR):
+    """Load the {output_path: key} manifest, or an empty one."""
+    try:
+        return json.loads((Path(cache_dir) / MANIFEST_FILE).read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(manifest, cache_dir=CACHE_DIR):
+    """Write the manifest atomically so an interrupted run never leaves it half-written."""
+    manifest_path = Path(cache_dir) / MANIFEST_FILE
+    manifest_path.parent.mkdir(exist_ok=True)
+    tmp_path = manifest_path.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps(manifest, indent=2, sort_keys=True))
+    os.replace(tmp_path, manifest_path)
+
+
+def is_fresh(manifest, output_file, key):
+    """True if the output exists and was last rendered from exactly these inputs."""
+    return manifest.get(str(output_file)) == key and Path(output_file).exists()
+
+
+def find_stale_outputs(output_dir, suffix, expected_files):
+    """Return outputs in output_dir ending in suffix that the current roster no longer produces."""
+    expected = {Path(path).name for path in expected_files}
+    return sorted(path for path in Path(output_dir).glob(f"*{suffix}") if path.name not in expected)
+
+
+def report_stale(stale_files, manifest, prune=False):
+    """Print (and optionally delete) stale outputs, dropping them from the manifest."""
+    for path in stale_files:
+        if prune:
+            path.unlink()
+            manifest.pop(str(path), None)
+            print(f"- Pruned stale output: {path}")
+        else:
+            print(f"! Stale output (not in roster, use --prune to delete): {path}")
+
+
+def add_cache_arguments(parser):
+    """Add the shared --force / --prune options to a generator's argument parser."""
+    parser.add_argument("--force", action="store_true",
+                        help="re-render every output, ignoring the build cache")
+    parser.add_argument("--prune", action="store_true",
+                        help="delete outputs for people no longer in the roster")
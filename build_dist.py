@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Build the deployable site for Deep Matters: Foundations into dist/.
+Starting from index.html, only the assets that the page and the JS configs it loads
+actually reference are collected. Each one is renamed with a hash of its content
+(images/logo.3f2a9c1b04.png), and the references are rewritten. Every file except
+index.html can then be served with immutable, year-long cache headers. Sources whose
+hash is unchanged since the last build are not copied again, and files from
+earlier builds that are no longer referenced are removed.
+
+The cache rules are written to _headers, which only Netlify and Cloudflare Pages read.
+GitHub Pages serves its own headers, so the Pages workflow drops _headers and
+asset-manifest.json from the uploaded bundle.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import shutil
+import sys
+from pathlib import Path
+
+from build_cache import file_digest
+
+# Configuration
+DIST_DIR = "dist"
+ENTRY_PAGES = ("index.html",)  # Served under their own names (never fingerprinted)
+MANIFEST_FILE = "asset-manifest.json"  # {source path: {"sha256": ..., "path": fingerprinted path}}
+HEADERS_FILE = "_headers"  # Cache rules for hosts that read them (Netlify, Cloudflare Pages)
+HASH_LENGTH = 10
+
+# Files whose references are followed and rewritten
+TEXT_EXTENSIONS = (".html", ".js", ".css")
+
+# A relative asset path inside an attribute, JS string, srcset or url(...), e.g. images/lei-ge.JPG
+ASSET_REFERENCE = re.compile(
+    r"(?<![\w./:-])((?:[\w@-]+/)*[\w@.-]+\.(?:png|jpe?g|webp|avif|gif|svg|ico|js|css))(?![\w.-])",
+    re.IGNORECASE,
+)
+
+IMMUTABLE = "Cache-Control: public, max-age=31536000, immutable"
+REVALIDATE = "Cache-Control: public, max-age=0, must-revalidate"
+
+
+def fingerprinted_name(path, digest):
+    """images/logo.png -> images/logo.<hash>.png"""
+    path = Path(path)
+    return (path.parent / f"{path.stem}.{digest[:HASH_LENGTH]}{path.suffix}").as_posix()
+
+
+def find_references(text, root="."):
+    """Asset paths referenced in text that exist under root, in order of first appearance."""
+    found = []
+    for match in ASSET_REFERENCE.finditer(text):
+        path = match.group(1)
+        if path not in found and (Path(root) / path).is_file():
+            found.append(path)
+    return found
+
+
+def rewrite_references(text, renamed):
+    """Replace every whole-path reference to a renamed asset."""
+    return ASSET_REFERENCE.sub(lambda match: renamed.get(match.group(1), match.group(1)), text)
+
+
+class DistBuilder:
+    """Walks references from the entry pages and writes fingerprinted copies into the dist directory."""
+
+    def __init__(self, root=".", dist_dir=DIST_DIR):
+        self.root = Path(root)
+        self.dist = Path(dist_dir)
+        self.previous = self._load_manifest()
+        self.manifest = {}
+        self.copied = 0
+        self.unchanged = 0
+
+    def _load_manifest(self):
+        try:
+            return json.loads((self.dist / MANIFEST_FILE).read_text())
+        except (OSError, ValueError):
+            return {}
+
+    def asset(self, path):
+        """Fingerprinted dist path of a source asset, building it (and what it references) if needed."""
+        if path in self.manifest:
+            return self.manifest[path]["path"]
+        source = self.root / path
+        if source.suffix.lower() in TEXT_EXTENSIONS:
+            data = self._rewritten(source)
+            digest = hashlib.sha256(data).hexdigest()
+        else:
+            data = None
+            digest = file_digest(source)
+
+        target = fingerprinted_name(path, digest)
+        self.manifest[path] = {"sha256": digest, "path": target}
+        if self.previous.get(path, {}).get("sha256") == digest and (self.dist / target).is_file():
+            self.unchanged += 1
+            return target
+
+        (self.dist / target).parent.mkdir(parents=True, exist_ok=True)
+        if data is None:
+            shutil.copyfile(source, self.dist / target)
+        else:
+            (self.dist / target).write_bytes(data)
+        self.copied += 1
+        print(f"✓ {path} -> {target}")
+        return target
+
+    def _rewritten(self, source):
+        # Dependencies first, so their fingerprints are known when this file is hashed
+        text = source.read_text(encoding="utf-8")
+        renamed = {path: self.asset(path) for path in find_references(text, self.root)}
+        return rewrite_references(text, renamed).encode("utf-8")
+
+    def page(self, path):
+        """Write an entry page under its own name, with references rewritten."""
+        (self.dist / path).parent.mkdir(parents=True, exist_ok=True)
+        (self.dist / path).write_bytes(self._rewritten(self.root / path))
+        print(f"✓ {path}")
+
+    def prune(self):
+        """Delete files from the previous build that this build no longer references. Returns how many.
+
+        Only paths listed in the previous manifest are touched, so other files in the
+        output directory are never deleted.
+        """
+        keep = {entry["path"] for entry in self.manifest.values()}
+        removed = 0
+        for entry in self.previous.values():
+            path = self.dist / entry["path"]
+            if entry["path"] in keep or not path.is_file():
+                continue
+            path.unlink()
+            removed += 1
+            # Remove the directories this left empty, up to the bundle root
+            for parent in path.parents:
+                if parent == self.dist or any(parent.iterdir()):
+                    break
+                parent.rmdir()
+        return removed
+
+    def write_manifest(self):
+        manifest_path = self.dist / MANIFEST_FILE
+        tmp_path = manifest_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(self.manifest, indent=2, sort_keys=True))
+        os.replace(tmp_path, manifest_path)
+
+    def write_headers(self):
+        """Immutable caching for fingerprinted assets, revalidation for the entry pages."""
+        lines = []
+        for page in ENTRY_PAGES:
+            lines += [f"/{page}", f"  {REVALIDATE}"]
+        lines += ["/", f"  {REVALIDATE}"]
+        for entry in sorted(self.manifest.values(), key=lambda entry: entry["path"]):
+            lines += [f"/{entry['path']}", f"  {IMMUTABLE}"]
+        (self.dist / HEADERS_FILE).write_text("\n".join(lines) + "\n")
+
+
+def output_problem(dist, root="."):
+    """Why dist cannot be used as the bundle directory for the sources in root, or None if it can."""
+    dist, root = Path(dist).resolve(), Path(root).resolve()
+    if dist == root or dist in root.parents:
+        return f"{dist} is the source tree or contains it"
+    if dist.is_dir() and any(dist.iterdir()) and not (dist / MANIFEST_FILE).is_file():
+        return f"{dist} is not empty and holds no {MANIFEST_FILE} from an earlier build"
+    return None
+
+
+def dist_size(dist_dir):
+    return sum(path.stat().st_size for path in Path(dist_dir).rglob("*") if path.is_file())
+
+
+def main(argv=None):
+    """Collect the referenced assets into a fingerprinted deploy bundle."""
+    parser = argparse.ArgumentParser(description="Build the fingerprinted deploy bundle in dist/.")
+    parser.add_argument("--output", default=DIST_DIR, metavar="DIR", help=f"bundle directory (default: {DIST_DIR})")
+    parser.add_argument("--clean", action="store_true", help="delete the bundle directory first")
+    args = parser.parse_args(argv)
+
+    dist = Path(args.output)
+    problem = output_problem(dist)
+    if problem:
+        print(f"✗ Refusing to build into {args.output}: {problem}")
+        sys.exit(1)
+    if args.clean and dist.exists():
+        shutil.rmtree(dist)
+    dist.mkdir(parents=True, exist_ok=True)
+
+    builder = DistBuilder(".", dist)
+    for page in ENTRY_PAGES:
+        builder.page(page)
+    builder.write_manifest()
+    builder.write_headers()
+    removed = builder.prune()
+
+    print(f"\nDone! {len(builder.manifest)} assets in {dist}/ ({builder.copied} written, "
+          f"{builder.unchanged} unchanged, {removed} stale removed), {dist_size(dist) / 1024:.1f} KB total")
+
+
+if __name__ == "__main__":
+    main()
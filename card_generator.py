@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Shared command-line generator behind the LinkedIn card scripts for Deep Matters: Foundations.
+generate_linkedin_images.py and generate_linkedin_images_square.py only pick a layout
+from card_layouts.LAYOUTS, an output directory and a file suffix. Loading the roster,
+build-cache checks, the decode/render/write pipeline and the summary all live here.
+"""
+
+import argparse
+from pathlib import Path
+
+import card_layouts
+from batch import add_jobs_argument, print_failure_summary
+from build_cache import (add_cache_arguments, find_stale_outputs, is_fresh, load_manifest,
+                         output_key, report_stale, save_manifest)
+from card_layouts import CONFERENCE_LOGO, photo_slot_size
+from encoding import (add_encoding_arguments, encoding_settings, format_stats, output_suffix,
+                      print_encoding_summary, save_image, settings_from_args)
+from fonts import describe_fonts
+from memory import estimate_cost, print_peak_memory
+from photo_utils import add_crop_cache_arguments, configure_crop_cache, load_square_photo
+from pipeline import add_pipeline_arguments, run_stages
+from roster import load_speakers
+from tracing import add_profile_argument, finish_profile, span, start_profile
+
+
+def generate_card(layout, speaker_id, speaker_data, conference_logo_path=CONFERENCE_LOGO, photo=None):
+    """Render a speaker's card in one of card_layouts.LAYOUTS."""
+    return card_layouts.render_card(layout, speaker_id, speaker_data, photo=photo,
+                                    conference_logo_path=conference_logo_path)
+
+
+def save_card(speaker_id, speaker_data, output_file, settings, layout):
+    """Render one card and write it to disk (runs inside a worker process with --jobs).
+
+    Returns (encode seconds, bytes written).
+    """
+    with span("render", subject=speaker_id):
+        img = generate_card(layout, speaker_id, speaker_data)
+        return save_image(img, output_file, settings or encoding_settings())
+
+
+def load_card_photo(speaker_id, speaker_data, output_file, settings, layout):
+    """Pipeline prefetch stage: decode and crop the photo for one save_card task."""
+    return load_square_photo(speaker_data["image"], min_size=photo_slot_size(layout))
+
+
+def render_card(task, photo, load_error):
+    """Pipeline render stage; a failed prefetch falls back to loading from the path like a direct render."""
+    speaker_id, speaker_data, _, _, layout = task
+    return generate_card(layout, speaker_id, speaker_data, photo=photo if load_error is None else None)
+
+
+def estimate_card_cost(speaker_id, speaker_data, output_file, settings, layout):
+    """Estimated peak bytes of one save_card task, from the photo's header (for --max-memory)."""
+    return estimate_cost(speaker_data["image"], photo_slot_size(layout), [card_layouts.LAYOUTS[layout]["size"]])
+
+
+def write_card(task, img):
+    """Pipeline write stage for one save_card task."""
+    return save_image(img, task[2], task[3] or encoding_settings())
+
+
+def render_inputs(speaker_data):
+    """Files a card's pixels depend on, for the incremental build cache."""
+    return card_layouts.render_inputs(speaker_data) + [__file__]
+
+
+def main(generator, argv=None):
+    """Generate one card per speaker for a card script.
+
+    generator is the script's module: its LAYOUT, OUTPUT_DIR, OUTPUT_SUFFIX and DESCRIPTION
+    choose the card, and its file and constants are part of every output's cache key.
+    """
+    parser = argparse.ArgumentParser(description=f"Generate {generator.DESCRIPTION}.")
+    add_cache_arguments(parser)
+    add_crop_cache_arguments(parser)
+    add_jobs_argument(parser)
+    add_pipeline_arguments(parser)
+    add_profile_argument(parser)
+    add_encoding_arguments(parser)
+    args = parser.parse_args(argv)
+    start_profile(args)
+    configure_crop_cache(args)
+    settings = settings_from_args(parser, args)
+    suffix = output_suffix(generator.OUTPUT_SUFFIX, settings)
+    speakers = load_speakers()
+
+    # Create output directory
+    output_path = Path(generator.OUTPUT_DIR)
+    output_path.mkdir(exist_ok=True)
+
+    print(f"Generating {generator.DESCRIPTION} for {len(speakers)} speakers...")
+    print(f"Output directory: {output_path.absolute()}")
+    for line in describe_fonts():
+        print(f"Font: {line}")
+
+    manifest = load_manifest()
+    pending = []
+    skipped = 0
+    for speaker_id, speaker_data in speakers.items():
+        output_file = output_path / f"{speaker_id}{suffix}"
+        key = output_key(generator, speaker_data, generator.render_inputs(speaker_data), settings)
+        if not args.force and is_fresh(manifest, output_file, key):
+            skipped += 1
+        else:
+            pending.append((speaker_id, speaker_data, output_file, key))
+
+    tasks = [(speaker_id, speaker_data, str(output_file), settings, generator.LAYOUT)
+             for speaker_id, speaker_data, output_file, _ in pending]
+    generated = 0
+    failures = []
+    all_stats = []
+    results = run_stages(tasks, args, save_card, load_card_photo, render_card, write_card,
+                         subject=lambda task: task[0], cost=estimate_card_cost)
+    for (speaker_id, _, output_file, key), (stats, error) in zip(pending, results):
+        if error is None:
+            manifest[str(output_file)] = key
+            generated += 1
+            all_stats.append(stats)
+            print(f"✓ Generated: {output_file} {format_stats(stats)}")
+        else:
+            failures.append((speaker_id, error))
+
+    expected = [f"{speaker_id}{suffix}" for speaker_id in speakers]
+    report_stale(find_stale_outputs(output_path, suffix, expected), manifest, prune=args.prune)
+    save_manifest(manifest)
+
+    print_encoding_summary(all_stats, settings)
+    print_failure_summary(failures)
+    print(f"\nDone! Generated {generated} images in {generator.OUTPUT_DIR}/ ({skipped} unchanged, skipped)")
+
+    print_peak_memory(args)
+    finish_profile(args)
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Declarative share-card layouts for Deep Matters: Foundations speakers.
+Each layout is data: canvas size, static layers (bands, logo, conference text,
+accent lines), a photo slot (shape, size, border, position) and per-speaker text
+and logo slots. render_card() draws any layout, pre-rendering the static layers
+once per layout and taking the photo slot from a shared PhotoPyramid, so an
+extra format costs one resize and a few draw calls per speaker.
+
+Positions are (x, y) in canvas pixels; an x of None centers the element horizontally.
+Speaker text is drawn at its nominal size when it fits the slot's box (width, height),
+otherwise it is wrapped and shrunk into the box with fonts.fit_text().
+"""
+
+from PIL import Image, ImageDraw
+import os
+from functools import lru_cache
+
+import fonts
+import masks
+import photo_utils
+from build_cache import file_mtime
+from fonts import find_font_path, fit_text, get_font, line_height, text_width
+from masks import composite_shaped_photo
+from photo_utils import photo_at
+from tracing import span
+
+# Conference details shown on every card
+CONFERENCE_NAME = "Deep Matters: Foundations"
+CONFERENCE_DATE = "May 16, 2025"
+CONFERENCE_LOCATION = "Imperial College London"
+CONFERENCE_LOGO = "images/logo.png"
+DATE_TEXT = f"{CONFERENCE_DATE} • {CONFERENCE_LOCATION}"
+
+# Colors (matching website theme)
+COLOR_BG = "#ffffff"
+COLOR_DARK = "#1f1f1f"
+COLOR_ACCENT = "#fab22b"
+COLOR_TEXT_PRIMARY = "#1f2937"
+COLOR_TEXT_SECONDARY = "#6b7280"
+
+LAYOUTS = {
+    # LinkedIn landscape share image
+    "landscape": {
+        "size": (1200, 627),
+        "background": COLOR_BG,
+        "layers": [
+            {"type": "gradient", "height": 627 // 3},
+            {"type": "logo", "xy": (40, 40), "height": 80, "padding": 20, "background": COLOR_BG},
+            {"type": "text", "text": CONFERENCE_NAME, "xy": (500, 120), "size": 32, "bold": True,
+             "color": COLOR_TEXT_PRIMARY},
+            {"type": "text", "text": DATE_TEXT, "xy": (500, 165), "size": 20, "color": COLOR_TEXT_SECONDARY},
+            {"type": "rect", "box": (500, 245, 800, 249), "color": COLOR_ACCENT},
+        ],
+        "photo": {"shape": "circle", "size": 280, "border": 6, "xy": (150, "middle")},
+        "texts": [
+            {"field": "name", "xy": (500, 285), "box": (660, 55), "size": 42, "bold": True, "color": COLOR_TEXT_PRIMARY},
+            {"field": "affiliation", "xy": (500, 340), "box": (660, 50), "size": 26, "color": COLOR_TEXT_SECONDARY},
+        ],
+        "affiliation_logo": {"xy": (500, 390), "height": 50, "max_width": 200},
+    },
+    # LinkedIn / Instagram square share image
+    "square": {
+        "size": (1080, 1080),
+        "background": COLOR_BG,
+        "layers": [
+            {"type": "rect", "box": (0, 0, 1080, 240), "color": COLOR_DARK},
+            {"type": "logo", "xy": (50, 35), "height": 70},
+            {"type": "text", "text": CONFERENCE_NAME, "xy": (50, 135), "size": 28, "bold": True, "color": "#ffffff"},
+            {"type": "text", "text": DATE_TEXT, "xy": (50, 170), "size": 17, "color": "#a0a0a0"},
+            {"type": "rect", "box": (415, 1065, 665, 1069), "color": COLOR_ACCENT},
+        ],
+        "photo": {"shape": "rounded", "size": 350, "radius": 25, "border": 6, "border_radius": 30, "xy": (None, 190)},
+        "texts": [
+            {"field": "name", "xy": (None, 592), "box": (960, 55), "size": 44, "bold": True, "color": COLOR_TEXT_PRIMARY},
+            {"field": "affiliation", "xy": (None, 647), "box": (960, 55), "size": 26, "color": COLOR_TEXT_SECONDARY},
+        ],
+        "affiliation_logo": {"xy": (None, 702), "height": 55, "max_width": 220},
+    },
+    # Instagram / LinkedIn story (9:16)
+    "story": {
+        "size": (1080, 1920),
+        "background": COLOR_BG,
+        "layers": [
+            {"type": "rect", "box": (0, 0, 1080, 480), "color": COLOR_DARK},
+            {"type": "logo", "xy": (60, 70), "height": 100},
+            {"type": "text", "text": CONFERENCE_NAME, "xy": (60, 210), "size": 44, "bold": True, "color": "#ffffff"},
+            {"type": "text", "text": DATE_TEXT, "xy": (60, 270), "size": 26, "color": "#a0a0a0"},
+            {"type": "rect", "box": (390, 1860, 690, 1866), "color": COLOR_ACCENT},
+        ],
+        "photo": {"shape": "circle", "size": 640, "border": 12, "xy": (None, 380)},
+        "texts": [
+            {"field": "name", "xy": (None, 1120), "box": (960, 100), "size": 72, "bold": True, "color": COLOR_TEXT_PRIMARY},
+            {"field": "affiliation", "xy": (None, 1220), "box": (960, 90), "size": 40, "color": COLOR_TEXT_SECONDARY},
+        ],
+        "affiliation_logo": {"xy": (None, 1310), "height": 96, "max_width": 380},
+    },
+    # X/Twitter large summary card (16:9)
+    "twitter": {
+        "size": (1600, 900),
+        "background": COLOR_BG,
+        "layers": [
+            {"type": "gradient", "height": 300},
+            {"type": "logo", "xy": (50, 50), "height": 100, "padding": 24, "background": COLOR_BG},
+            {"type": "text", "text": CONFERENCE_NAME, "xy": (680, 140), "size": 42, "bold": True, "color": "#ffffff"},
+            {"type": "text", "text": DATE_TEXT, "xy": (680, 200), "size": 26, "color": "#a0a0a0"},
+            {"type": "rect", "box": (680, 330, 1080, 335), "color": COLOR_ACCENT},
+        ],
+        "photo": {"shape": "circle", "size": 400, "border": 8, "xy": (180, "middle")},
+        "texts": [
+            {"field": "name", "xy": (680, 380), "box": (860, 75), "size": 56, "bold": True, "color": COLOR_TEXT_PRIMARY},
+            {"field": "affiliation", "xy": (680, 455), "box": (860, 65), "size": 34, "color": COLOR_TEXT_SECONDARY},
+        ],
+        "affiliation_logo": {"xy": (680, 520), "height": 64, "max_width": 260},
+    },
+}
+
+
+def gradient_band(width, band_height):
+    """Dark-to-black band matching the original row-by-row gradient, built in one resize."""
+    # Row i gets int(30 * (1 - i / band_height)); the last one-pixel rectangle also
+    # covered row band_height, so that row repeats the final value
+    column = [int(30 * (1 - i / band_height)) for i in range(band_height)]
+    column.append(column[-1])
+    band = Image.frombytes('L', (1, len(column)), bytes(column))
+    return band.resize((width, len(column)), Image.NEAREST).convert('RGB')
+
+
+def render_inputs(speaker_data):
+    """Files a card's pixels depend on, for the incremental build cache."""
+    return [
+        speaker_data["image"],
+        speaker_data.get("logo"),
+        CONFERENCE_LOGO,
+        find_font_path(bold=False),
+        find_font_path(bold=True),
+        __file__,
+        fonts.__file__,  # Wrapping and shrink-to-fit (fit_text)
+        photo_utils.__file__,
+        masks.__file__,
+    ]
+
+
+def photo_slot_size(layout_name):
+    """Side in pixels of a layout's photo (inside the border)."""
+    return LAYOUTS[layout_name]["photo"]["size"]
+
+
+def _x_for(x, width, canvas_width):
+    return (canvas_width - width) // 2 if x is None else x
+
+
+def shaped_photo(source, slot, canvas=None, xy=(0, 0)):
+    """Photo cut to the slot's shape with an anti-aliased border.
+
+    Returns an RGBA image, or draws onto canvas in place with xy as the border's top-left corner.
+    """
+    img = photo_at(source, slot["size"])
+    with span("composite"):
+        return composite_shaped_photo(img, slot["shape"], slot["border"], COLOR_ACCENT, slot.get("radius", 0),
+                                      slot.get("border_radius", 0), canvas, xy)
+
+
+def _fit_logo(logo, height, max_width=None):
+    """Resize a logo to height, shrinking it further if it would be wider than max_width."""
+    width = int(logo.width * (height / logo.height))
+    if max_width and width > max_width:
+        width = max_width
+        height = int(logo.height * (width / logo.width))
+    return logo.resize((width, height), Image.LANCZOS)
+
+
+def _draw_layer(img, draw, layer, conference_logo_path):
+    canvas_width = img.width
+    if layer["type"] == "gradient":
+        img.paste(gradient_band(canvas_width, layer["height"]), (0, 0))
+    elif layer["type"] == "rect":
+        x0, y0, x1, y1 = layer["box"]
+        draw.rectangle([(x0, y0), (x1, y1)], fill=layer["color"])
+    elif layer["type"] == "text":
+        font = get_font(layer["size"], bold=layer.get("bold", False))
+        x = _x_for(layer["xy"][0], text_width(layer["text"], font), canvas_width)
+        draw.text((x, layer["xy"][1]), layer["text"], fill=layer["color"], font=font)
+    elif layer["type"] == "logo":
+        try:
+            with Image.open(conference_logo_path) as source:
+                logo = _fit_logo(source, layer["height"])
+            padding = layer.get("padding", 0)
+            if "background" in layer:
+                # Logo on its own padded background box
+                box = Image.new('RGB', (logo.width + 2 * padding, logo.height + 2 * padding), layer["background"])
+                box.paste(logo, (padding, padding), logo if logo.mode == 'RGBA' else None)
+                img.paste(box, layer["xy"])
+            else:
+                img.paste(logo, layer["xy"], logo if logo.mode == 'RGBA' else None)
+        except Exception as e:
+            print(f"Could not load conference logo: {e}")
+    else:
+        raise ValueError(f"Unknown layer type: {layer['type']}")
+
+
+@lru_cache(maxsize=16)
+def _build_template(layout_name, conference_logo_path, logo_mtime):
+    layout = LAYOUTS[layout_name]
+    img = Image.new('RGB', layout["size"], layout["background"])
+    draw = ImageDraw.Draw(img)
+    for layer in layout["layers"]:
+        _draw_layer(img, draw, layer, conference_logo_path)
+    return img
+
+
+def get_template(layout_name, conference_logo_path=CONFERENCE_LOGO):
+    """Speaker-independent layers of a layout, rendered once per layout and logo version.
+
+    Callers must copy() the result before drawing on it.
+    """
+    return _build_template(layout_name, conference_logo_path, file_mtime(conference_logo_path))
+
+
+@lru_cache(maxsize=32)
+def _build_logo(logo_path, logo_mtime, height, max_width):
+    with Image.open(logo_path) as source:
+        return _fit_logo(source, height, max_width)
+
+
+def get_logo(logo_path, height, max_width=None):
+    """An affiliation logo fitted to a slot, decoded and resized once per logo version and slot size.
+
+    Callers must not draw on the result.
+    """
+    return _build_logo(logo_path, file_mtime(logo_path), height, max_width)
+
+
+def render_card(layout_name, speaker_id, speaker_data, photo=None, conference_logo_path=CONFERENCE_LOGO):
+    """Render one speaker's card in the named layout.
+
+    photo may be a PhotoPyramid or a pre-cropped square; without it the photo is loaded from speaker_data["image"].
+    """
+    layout = LAYOUTS[layout_name]
+    canvas_width, canvas_height = layout["size"]
+
+    # Start from a copy of the pre-rendered static layers
+    with span("template"):
+        img = get_template(layout_name, conference_logo_path).copy()
+    draw = ImageDraw.Draw(img)
+
+    # Speaker photo
+    slot = layout["photo"]
+    try:
+        # Drawn straight onto the card, without an intermediate RGBA layer
+        outer = slot["size"] + 2 * slot["border"]
+        x, y = slot["xy"]
+        x = _x_for(x, outer, canvas_width)
+        y = (canvas_height - outer) // 2 if y == "middle" else y
+        shaped_photo(photo if photo is not None else speaker_data["image"], slot, img, (x, y))
+    except Exception as e:
+        print(f"Could not load speaker photo for {speaker_id}: {e}")
+
+    # Name and affiliation, wrapped and shrunk to fit their boxes
+    for text_slot in layout["texts"]:
+        text = speaker_data[text_slot["field"]]
+        bold = text_slot.get("bold", False)
+        size, lines = fit_text(text, *text_slot["box"], text_slot["size"], bold=bold)
+        font = get_font(size, bold=bold)
+        x, y = text_slot["xy"]
+        with span("draw.text", text=text):
+            for i, line in enumerate(lines):
+                draw.text((_x_for(x, text_width(line, font), canvas_width), y + i * line_height(size)), line,
+                          fill=text_slot["color"], font=font)
+
+    # Affiliation logo, if available
+    logo_slot = layout.get("affiliation_logo")
+    if logo_slot and speaker_data.get("logo") and os.path.exists(speaker_data["logo"]):
+        try:
+            with span("logo load", logo=speaker_data["logo"]):
+                logo = get_logo(speaker_data["logo"], logo_slot["height"], logo_slot["max_width"])
+            x = _x_for(logo_slot["xy"][0], logo.width, canvas_width)
+            img.paste(logo, (x, logo_slot["xy"][1]), logo if logo.mode == 'RGBA' else None)
+        except Exception as e:
+            print(f"Could not load affiliation logo for {speaker_id}: {e}")
+
+    return img
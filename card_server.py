@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Local preview server for Deep Matters: Foundations cards and avatars.
+Renders on request instead of writing files:
+  /card/{speaker_id}?format=landscape|square|story|twitter
+  /avatar/{person_id}?size=200[&roster=organizers]
+Decoded photos and rendered images live in size-bounded LRU caches keyed on the
+source files' mtimes and the config entry, so editing a photo, logo or config
+entry shows up on the next reload while fonts, logos and card templates stay warm.
+"""
+
+import argparse
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import card_layouts
+import generate_speaker_avatars as speaker_avatars
+from build_cache import file_mtime
+from card_layouts import LAYOUTS
+from encoding import PROFILES, add_encoding_arguments, encode_image, settings_from_args
+from photo_utils import add_crop_cache_arguments, configure_crop_cache, load_square_photo
+from roster import ORGANIZERS_CONFIG, SPEAKERS_CONFIG, load_organizers, load_speakers
+
+# Configuration
+HOST = "127.0.0.1"
+PORT = 8000
+RESULT_CACHE_MB = 64  # Encoded cards and avatars
+PHOTO_CACHE_MB = 256  # Decoded, center-cropped source photos
+MIN_AVATAR_SIZE = 16
+MAX_AVATAR_SIZE = 1024
+CACHE_MAX_AGE = 300  # Cache-Control max-age (seconds) for a CDN in front of the server
+
+# Card formats served under /card/{speaker_id}?format=... (every layout in card_layouts.LAYOUTS)
+CARD_FORMATS = tuple(LAYOUTS)
+
+# Rosters served under /avatar/{person_id}?roster=...
+ROSTERS = {
+    "speakers": (SPEAKERS_CONFIG, load_speakers),
+    "organizers": (ORGANIZERS_CONFIG, load_organizers),
+}
+
+CONTENT_TYPES = {"PNG": "image/png", "WEBP": "image/webp"}
+
+
+class LRUCache:
+    """Thread-safe LRU map bounded by the total cost (bytes) of its values."""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.total = 0
+        self.hits = 0
+        self.misses = 0
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return item[0]
+
+    def put(self, key, value, cost):
+        with self._lock:
+            if key in self._items:
+                self.total -= self._items.pop(key)[1]
+            if cost > self.max_bytes:
+                return
+            self._items[key] = (value, cost)
+            self.total += cost
+            while self.total > self.max_bytes:
+                _, (_, evicted_cost) = self._items.popitem(last=False)
+                self.total -= evicted_cost
+
+    def stats(self):
+        with self._lock:
+            return {"entries": len(self._items), "bytes": self.total, "max_bytes": self.max_bytes,
+                    "hits": self.hits, "misses": self.misses}
+
+
+class CardRenderer:
+    """Rosters, decoded photos and encoded results shared by every request thread."""
+
+    def __init__(self, settings, result_cache_mb=RESULT_CACHE_MB, photo_cache_mb=PHOTO_CACHE_MB):
+        self.settings = settings
+        self.results = LRUCache(result_cache_mb * 1024 * 1024)
+        self.photos = LRUCache(photo_cache_mb * 1024 * 1024)
+        self._rosters = {}
+        self._roster_lock = threading.Lock()
+
+    def roster(self, name):
+        """Roster data, re-read only when its config file changes."""
+        path, loader = ROSTERS[name]
+        mtime = file_mtime(path)
+        with self._roster_lock:
+            cached = self._rosters.get(name)
+            if cached is None or cached[0] != mtime:
+                cached = (mtime, loader(path))
+                self._rosters[name] = cached
+            return cached[1]
+
+    def photo(self, image_path, min_size):
+        """Decoded, center-cropped photo, cached per (file, mtime, decode size)."""
+        key = (image_path, file_mtime(image_path), min_size)
+        photo = self.photos.get(key)
+        if photo is None:
+            photo = load_square_photo(image_path, min_size=min_size)
+            self.photos.put(key, photo, photo.width * photo.height * len(photo.getbands()))
+        return photo
+
+    def _cached(self, key, render):
+        """Encoded bytes for key, rendering and caching on a miss. Returns (bytes, etag)."""
+        body = self.results.get(key)
+        if body is None:
+            body = encode_image(render(), self.settings)
+            self.results.put(key, body, len(body))
+        etag = hashlib.sha256(repr(key).encode("utf-8")).hexdigest()[:16]
+        return body, etag
+
+    def _signature(self, paths, person):
+        # Changing any input file or the person's config entry gives a new cache key
+        return (tuple((path, file_mtime(path)) for path in paths if path),
+                json.dumps(person, sort_keys=True), self.settings["profile"], self.settings["quantize"])
+
+    def card(self, speaker_id, format_name):
+        speaker = self.roster("speakers")[speaker_id]
+        key = ("card", format_name, speaker_id, self._signature(card_layouts.render_inputs(speaker), speaker))
+        return self._cached(key, lambda: card_layouts.render_card(
+            format_name, speaker_id, speaker,
+            photo=self.photo(speaker["image"], card_layouts.photo_slot_size(format_name))))
+
+    def avatar(self, person_id, size, roster="speakers"):
+        person = self.roster(roster)[person_id]
+        # Keep the border in proportion to the generated 400px avatars
+        border_width = max(1, round(speaker_avatars.BORDER_WIDTH * size / speaker_avatars.AVATAR_SIZE))
+        inner_size = size - 2 * border_width
+        key = ("avatar", roster, person_id, size, self._signature(speaker_avatars.render_inputs(person), person))
+        return self._cached(key, lambda: speaker_avatars.create_circular_avatar(
+            self.photo(person["image"], inner_size), size=size, border_width=border_width,
+            border_color=speaker_avatars.COLOR_ACCENT))
+
+
+def make_handler(renderer):
+    """Request handler class bound to a shared CardRenderer."""
+    content_type = CONTENT_TYPES[PROFILES[renderer.settings["profile"]]["format"]]
+
+    class CardRequestHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlsplit(self.path)
+            query = {name: values[-1] for name, values in parse_qs(url.query).items()}
+            parts = [part for part in url.path.split("/") if part]
+            try:
+                if not parts:
+                    return self._send_index()
+                if parts == ["stats"]:
+                    return self._send_json({"results": renderer.results.stats(), "photos": renderer.photos.stats()})
+                if len(parts) == 2 and parts[0] == "card":
+                    if parts[1] not in renderer.roster("speakers"):
+                        return self._send_error(HTTPStatus.NOT_FOUND, f"unknown speaker: {parts[1]}")
+                    format_name = query.get("format", "landscape")
+                    if format_name not in CARD_FORMATS:
+                        return self._send_error(HTTPStatus.BAD_REQUEST,
+                                                f"format must be one of: {', '.join(CARD_FORMATS)}")
+                    return self._send_image(*renderer.card(parts[1], format_name))
+                if len(parts) == 2 and parts[0] == "avatar":
+                    roster = query.get("roster", "speakers")
+                    size = int(query.get("size", speaker_avatars.AVATAR_SIZE))
+                    if roster not in ROSTERS:
+                        return self._send_error(HTTPStatus.BAD_REQUEST, f"roster must be one of: {', '.join(ROSTERS)}")
+                    if parts[1] not in renderer.roster(roster):
+                        return self._send_error(HTTPStatus.NOT_FOUND, f"unknown {roster[:-1]}: {parts[1]}")
+                    if not MIN_AVATAR_SIZE <= size <= MAX_AVATAR_SIZE:
+                        return self._send_error(HTTPStatus.BAD_REQUEST,
+                                                f"size must be between {MIN_AVATAR_SIZE} and {MAX_AVATAR_SIZE}")
+                    return self._send_image(*renderer.avatar(parts[1], size, roster))
+                return self._send_error(HTTPStatus.NOT_FOUND, "unknown path")
+            except ValueError as e:
+                return self._send_error(HTTPStatus.BAD_REQUEST, str(e))
+            except Exception as e:
+                return self._send_error(HTTPStatus.INTERNAL_SERVER_ERROR, f"render failed: {e}")
+
+        def _send_image(self, body, etag):
+            etag = f'"{etag}"'
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(HTTPStatus.NOT_MODIFIED)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                return
+            self._send(HTTPStatus.OK, content_type, body,
+                       {"ETag": etag, "Cache-Control": f"public, max-age={CACHE_MAX_AGE}"})
+
+        def _send_index(self):
+            links = [f'<li><a href="/card/{speaker_id}?format={format_name}">{speaker_id} ({format_name})</a></li>'
+                     for speaker_id in renderer.roster("speakers") for format_name in CARD_FORMATS]
+            links += [f'<li><a href="/avatar/{person_id}?size=200&roster={roster}">{person_id} avatar ({roster})</a></li>'
+                      for roster in ROSTERS for person_id in renderer.roster(roster)]
+            page = f"<!doctype html><title>Deep Matters cards</title><ul>{''.join(links)}</ul>"
+            self._send(HTTPStatus.OK, "text/html; charset=utf-8", page.encode("utf-8"))
+
+        def _send_json(self, data):
+            self._send(HTTPStatus.OK, "application/json", json.dumps(data, indent=2).encode("utf-8"))
+
+        def _send_error(self, status, message):
+            self._send(status, "text/plain; charset=utf-8", f"{status.value} {status.phrase}: {message}\n".encode("utf-8"))
+
+        def _send(self, status, mime_type, body, headers=None):
+            self.send_response(status)
+            self.send_header("Content-Type", mime_type)
+            self.send_header("Content-Length", str(len(body)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+    return CardRequestHandler
+
+
+def main(argv=None):
+    """Serve cards and avatars rendered on request."""
+    parser = argparse.ArgumentParser(description="Serve LinkedIn cards and avatars rendered on request.")
+    parser.add_argument("--host", default=HOST, help=f"interface to listen on (default: {HOST})")
+    parser.add_argument("--port", type=int, default=PORT, help=f"port to listen on (default: {PORT})")
+    parser.add_argument("--cache-mb", type=int, default=RESULT_CACHE_MB,
+                        help=f"memory for rendered images (default: {RESULT_CACHE_MB} MB)")
+    parser.add_argument("--photo-cache-mb", type=int, default=PHOTO_CACHE_MB,
+                        help=f"memory for decoded source photos (default: {PHOTO_CACHE_MB} MB)")
+    add_encoding_arguments(parser, default="draft")  # fast previews
+    add_crop_cache_arguments(parser)
+    args = parser.parse_args(argv)
+    settings = settings_from_args(parser, args)
+    configure_crop_cache(args)
+
+    renderer = CardRenderer(settings, args.cache_mb, args.photo_cache_mb)
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(renderer))
+    print(f"Serving Deep Matters cards on http://{args.host}:{args.port}/ ({settings['profile']} encoding)")
+    print(f"  /card/{{speaker_id}}?format={'|'.join(CARD_FORMATS)}")
+    print("  /avatar/{person_id}?size=200[&roster=organizers]")
+    print("  /stats")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nStopped.")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
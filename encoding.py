@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Named encoding profiles for the Deep Matters image generators.
+  draft          fast PNG (zlib level 1) for layout iteration
+  publish        smallest PNG (optimize + zlib level 9), optionally palette-quantized
+  webp-lossless  lossless WebP
+Every save reports its encode time and output size.
+"""
+
+import io
+import time
+from pathlib import Path
+
+from PIL import Image
+
+from tracing import span
+
+# Encoding profiles: Pillow format, file extension and save options
+PROFILES = {
+    "draft": {
+        "format": "PNG",
+        "extension": ".png",
+        "options": {"compress_level": 1},
+    },
+    "publish": {
+        "format": "PNG",
+        "extension": ".png",
+        "options": {"optimize": True, "compress_level": 9},
+    },
+    "webp-lossless": {
+        "format": "WEBP",
+        "extension": ".webp",
+        "options": {"lossless": True, "quality": 80, "method": 4},
+    },
+}
+DEFAULT_PROFILE = "publish"
+
+
+def add_encoding_arguments(parser, default=DEFAULT_PROFILE):
+    """Add the shared --encoding / --quantize options to a generator's argument parser."""
+    parser.add_argument("--encoding", choices=sorted(PROFILES), default=default,
+                        help=f"output encoding profile (default: {default})")
+    parser.add_argument("--quantize", type=int, default=0, metavar="COLORS",
+                        help="reduce PNG outputs to an adaptive palette of COLORS entries (0 = off)")
+
+
+def encoding_settings(profile=DEFAULT_PROFILE, quantize=0):
+    """Settings dict passed to workers and folded into build-cache keys."""
+    if profile not in PROFILES:
+        raise ValueError(f"Unknown encoding profile: {profile}")
+    if quantize and PROFILES[profile]["format"] != "PNG":
+        raise ValueError("--quantize only applies to PNG profiles")
+    return {"profile": profile, "quantize": quantize}
+
+
+def settings_from_args(parser, args):
+    """Encoding settings from parsed --encoding / --quantize, reporting bad combinations as usage errors."""
+    try:
+        return encoding_settings(args.encoding, args.quantize)
+    except ValueError as e:
+        parser.error(str(e))
+
+
+def output_suffix(suffix, settings):
+    """Swap the extension of an output suffix like '-avatar.png' for the profile's one."""
+    return str(Path(suffix).with_suffix(PROFILES[settings["profile"]]["extension"]))
+
+
+def quantize_image(img, colors):
+    """Adaptive-palette version of img (alpha is kept for RGBA avatars)."""
+    method = Image.Quantize.FASTOCTREE if img.mode == "RGBA" else Image.Quantize.MEDIANCUT
+    return img.quantize(colors=colors, method=method)
+
+
+def encode_image(img, settings):
+    """Encode img with the given settings into bytes (for serving instead of writing a file)."""
+    profile = PROFILES[settings["profile"]]
+    with span("encode"):
+        if settings["quantize"]:
+            img = quantize_image(img, settings["quantize"])
+        buffer = io.BytesIO()
+        img.save(buffer, profile["format"], **profile["options"])
+    return buffer.getvalue()
+
+
+def save_image(img, output_file, settings):
+    """Encode and write img with the given settings. Returns (encode seconds, bytes written)."""
+    profile = PROFILES[settings["profile"]]
+    with span("encode/write", file=Path(output_file).name):
+        start = time.perf_counter()
+        if settings["quantize"]:
+            img = quantize_image(img, settings["quantize"])
+        img.save(output_file, profile["format"], **profile["options"])
+        elapsed = time.perf_counter() - start
+    return elapsed, Path(output_file).stat().st_size
+
+
+def format_stats(stats):
+    """Human-readable '(12.3 ms, 45.6 KB)' for an (encode seconds, bytes) pair."""
+    seconds, size = stats
+    return f"({seconds * 1000:.1f} ms, {size / 1024:.1f} KB)"
+
+
+def print_encoding_summary(all_stats, settings):
+    """Print total encode time and bytes for a batch."""
+    if not all_stats:
+        return
+    total_time = sum(seconds for seconds, _ in all_stats)
+    total_size = sum(size for _, size in all_stats)
+    label = settings["profile"] + (f", {settings['quantize']} colors" if settings["quantize"] else "")
+    print(f"Encoding ({label}): {len(all_stats)} outputs, {total_time:.2f} s, {total_size / 1024:.1f} KB total")
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Font registry for the Deep Matters image generators.
+Each (family, weight) is resolved to a font file once, FreeType faces are cached
+per size, and text bounding boxes are memoized per (text, font), so rendering
+thousands of cards never re-probes the filesystem or re-measures the same string.
+
+fit_text() wraps and shrinks text into a box. Candidate sizes are binary-searched
+against per-font glyph advance tables measured once at a reference size and
+scaled linearly, so only the chosen size is measured with FreeType.
+"""
+
+from functools import lru_cache
+import os
+
+from PIL import ImageFont
+
+# Font fallbacks per (family, weight), in order of preference
+FONT_CANDIDATES = {
+    ("sans", "regular"): [
+        "/System/Library/Fonts/Supplemental/Arial.ttf",
+        "/System/Library/Fonts/Helvetica.ttc",
+        "/Library/Fonts/Arial.ttf",
+        "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+    ],
+    ("sans", "bold"): [
+        "/System/Library/Fonts/Supplemental/Arial Bold.ttf",
+        "/System/Library/Fonts/Helvetica.ttc",
+        "/Library/Fonts/Arial Bold.ttf",
+        "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
+    ],
+}
+
+# Candidates that exist on disk but FreeType refused to load: {path: error message}
+LOAD_ERRORS = {}
+
+# Auto-fit text
+REFERENCE_SIZE = 256  # Glyph advances are measured once at this size and scaled
+LINE_SPACING = 1.2  # Line height as a multiple of the font size
+MIN_FIT_SCALE = 0.5  # Smallest size fit_text() shrinks to, relative to the nominal size
+
+# Glyph advance tables per (family, weight): {character: advance at REFERENCE_SIZE}
+GLYPH_ADVANCES = {}
+
+
+def _weight(bold):
+    return "bold" if bold else "regular"
+
+
+@lru_cache(maxsize=None)
+def resolve_font(family="sans", weight="regular"):
+    """Return the first candidate file for (family, weight) that FreeType can load, or None."""
+    for path in FONT_CANDIDATES[(family, weight)]:
+        if not os.path.exists(path):
+            continue
+        try:
+            ImageFont.truetype(path, 12)
+            return path
+        except OSError as e:
+            LOAD_ERRORS[path] = str(e)
+            print(f"Could not load font {path}: {e}")
+    return None
+
+
+def find_font_path(bold=False, family="sans"):
+    """Font file chosen for this weight, or None when falling back to Pillow's default font."""
+    return resolve_font(family, _weight(bold))
+
+
+@lru_cache(maxsize=None)
+def get_font(size, bold=False, family="sans"):
+    """Get a cached font face with fallback options."""
+    path = resolve_font(family, _weight(bold))
+    if path is None:
+        return ImageFont.load_default()
+    return ImageFont.truetype(path, size)
+
+
+@lru_cache(maxsize=65536)
+def text_bbox(text, font):
+    """Memoized bounding box of text drawn at (0, 0), same as draw.textbbox((0, 0), text, font=font)."""
+    return font.getbbox(text)
+
+
+def text_width(text, font):
+    """Width in pixels of text in the given font."""
+    left, _, right, _ = text_bbox(text, font)
+    return right - left
+
+
+def glyph_advance(char, bold=False, family="sans"):
+    """Advance width of one character at REFERENCE_SIZE, measured the first time it is seen."""
+    advances = GLYPH_ADVANCES.setdefault((family, _weight(bold)), {})
+    if char not in advances:
+        advances[char] = get_font(REFERENCE_SIZE, bold, family).getlength(char)
+    return advances[char]
+
+
+def estimated_width(text, size, bold=False, family="sans"):
+    """Width of text at size from the cached advance tables (ignores kerning and hinting)."""
+    return sum(glyph_advance(char, bold, family) for char in text) * size / REFERENCE_SIZE
+
+
+def wrap_words(text, max_width, size, bold=False, family="sans"):
+    """Greedily break text into lines at spaces so each line's estimated width fits max_width."""
+    space = estimated_width(" ", size, bold, family)
+    lines = []
+    line, line_width = [], 0
+    for word in text.split():
+        word_width = estimated_width(word, size, bold, family)
+        if line and line_width + space + word_width > max_width:
+            lines.append(" ".join(line))
+            line, line_width = [], 0
+        line_width += (space if line else 0) + word_width
+        line.append(word)
+    lines.append(" ".join(line))
+    return lines
+
+
+def line_height(size):
+    return int(size * LINE_SPACING)
+
+
+def _fits(lines, size, max_width, max_height, measure):
+    if len(lines) > 1 and len(lines) * line_height(size) > max_height:
+        return False
+    return all(measure(line) <= max_width for line in lines)
+
+
+@lru_cache(maxsize=65536)
+def fit_text(text, max_width, max_height, size, min_size=None, bold=False, family="sans"):
+    """Largest font size (at most size) and lines at which text fits a max_width x max_height box.
+
+    Text that fits on one line at size is returned as is. Otherwise sizes down to
+    min_size (default: MIN_FIT_SCALE x size) are binary-searched with the estimated
+    widths, wrapping at spaces, and only the winner is checked against real glyph
+    boxes (stepping down if hinting made it a little wider). Returns (size, [lines]);
+    text that cannot fit even at min_size is wrapped at min_size.
+    """
+    if resolve_font(family, _weight(bold)) is None or text_width(text, get_font(size, bold, family)) <= max_width:
+        return size, [text]
+
+    min_size = min_size or max(1, int(size * MIN_FIT_SCALE))
+    low, high = min_size, size - 1
+    best = min_size
+    while low <= high:
+        middle = (low + high) // 2
+        lines = wrap_words(text, max_width, middle, bold, family)
+        if _fits(lines, middle, max_width, max_height, lambda line: estimated_width(line, middle, bold, family)):
+            best, low = middle, middle + 1
+        else:
+            high = middle - 1
+
+    for candidate in range(best, min_size - 1, -1):
+        font = get_font(candidate, bold, family)
+        lines = wrap_words(text, max_width, candidate, bold, family)
+        if _fits(lines, candidate, max_width, max_height, lambda line: text_width(line, font)):
+            return candidate, lines
+    return min_size, wrap_words(text, max_width, min_size, bold, family)
+
+
+def describe_fonts(family="sans"):
+    """One line per weight saying which font file was chosen (or that the default is used)."""
+    lines = []
+    for (candidate_family, weight) in FONT_CANDIDATES:
+        if candidate_family != family:
+            continue
+        path = resolve_font(family, weight)
+        lines.append(f"{family} {weight}: {path or 'Pillow default font (no candidate found)'}")
+    for path, error in LOAD_ERRORS.items():
+        lines.append(f"skipped {path}: {error}")
+    return lines
+
+
+if __name__ == "__main__":
+    print("\n".join(describe_fonts()))
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Pack the generated speaker and organizer avatars into one sprite sheet for the website.
+Each avatar is scaled to its display size (and 2x for high-DPI screens) and placed
+with a MaxRects bin packer; avatar-atlas.js holds the sprite coordinates that
+index.html uses, so the speaker and organizer grids load one image instead of one per person.
+Sheets are lossy AVIF and WebP, encoded like the responsive photo derivatives, so the
+one sheet stays lighter than the derivatives it replaces.
+Run generate_speaker_avatars.py and generate_organizer_avatars.py first.
+"""
+
+from PIL import Image
+import argparse
+import json
+import math
+from pathlib import Path
+
+import generate_organizer_avatars as organizer_avatars
+import generate_speaker_avatars as speaker_avatars
+from generate_responsive_images import ENCODERS, OUTPUT_FORMATS
+from roster import load_organizers, load_speakers
+from site_data import ATLAS_FILE, DISPLAY_SIZES
+
+# Configuration
+OUTPUT_DIR = "avatar_atlas"
+DATA_FILE = ATLAS_FILE
+SCALES = (1, 2)  # 1x sheet plus a 2x sheet for high-DPI screens
+PADDING = 2  # Gap between sprites (CSS pixels), so filtering never bleeds neighbours
+
+# Sprites are clipped to circles on the page (border-radius), so the sheets are flattened onto
+# the avatar border color: no alpha channel to encode, and any edge bleed matches the ring
+SHEET_BACKGROUND = speaker_avatars.COLOR_ACCENT
+
+# Avatar sources per roster: where the generated avatars are and which suffix they use
+AVATAR_SOURCES = {
+    "speakers": (speaker_avatars.OUTPUT_DIR, speaker_avatars.OUTPUT_SUFFIX),
+    "organizers": (organizer_avatars.OUTPUT_DIR, organizer_avatars.OUTPUT_SUFFIX),
+}
+
+
+def _place(free_rects, width, height):
+    """Bottom-left MaxRects choice: the free rectangle giving the lowest top edge, then leftmost."""
+    best = None
+    for fx, fy, fw, fh in free_rects:
+        if width <= fw and height <= fh and (best is None or (fy + height, fx) < (best[1] + height, best[0])):
+            best = (fx, fy)
+    return best
+
+
+def _split_free_rects(free_rects, placed):
+    """Subtract a placed rectangle from every free rectangle it overlaps (MaxRects split + prune)."""
+    px, py, pw, ph = placed
+    result = []
+    for fx, fy, fw, fh in free_rects:
+        if px >= fx + fw or px + pw <= fx or py >= fy + fh or py + ph <= fy:
+            result.append((fx, fy, fw, fh))
+            continue
+        if px > fx:
+            result.append((fx, fy, px - fx, fh))
+        if px + pw < fx + fw:
+            result.append((px + pw, fy, fx + fw - px - pw, fh))
+        if py > fy:
+            result.append((fx, fy, fw, py - fy))
+        if py + ph < fy + fh:
+            result.append((fx, py + ph, fw, fy + fh - py - ph))
+
+    # Drop free rectangles fully contained in another one
+    pruned = []
+    for i, (ax, ay, aw, ah) in enumerate(result):
+        contained = any(
+            j != i and bx <= ax and by <= ay and ax + aw <= bx + bw and ay + ah <= by + bh
+            and (j < i or (bx, by, bw, bh) != (ax, ay, aw, ah))
+            for j, (bx, by, bw, bh) in enumerate(result)
+        )
+        if not contained:
+            pruned.append((ax, ay, aw, ah))
+    return pruned
+
+
+def pack_rectangles(sizes, bin_width):
+    """Pack (width, height) rectangles into a strip bin_width wide using MaxRects (bottom-left rule).
+
+    Larger rectangles are placed first. Returns ([(x, y)] in input order, used height),
+    or None if some rectangle is wider than the strip.
+    """
+    if any(width > bin_width for width, _ in sizes):
+        return None
+    unbounded = sum(height for _, height in sizes)
+    free_rects = [(0, 0, bin_width, unbounded)]
+    positions = [None] * len(sizes)
+    order = sorted(range(len(sizes)), key=lambda i: (-max(sizes[i]), -sizes[i][0] * sizes[i][1], i))
+    for i in order:
+        width, height = sizes[i]
+        x, y = _place(free_rects, width, height)
+        positions[i] = (x, y)
+        free_rects = _split_free_rects(free_rects, (x, y, width, height))
+    used_height = max((y + sizes[i][1] for i, (x, y) in enumerate(positions)), default=0)
+    return positions, used_height
+
+
+def pack_atlas(sizes):
+    """Pick the strip width giving the squarest (then smallest) sheet. Returns (positions, width, height)."""
+    area = sum(width * height for width, height in sizes)
+    widest = max(width for width, _ in sizes)
+    side = max(widest, math.ceil(math.sqrt(area)))
+    best = None
+    for candidate in sorted({side, int(side * 1.25), int(side * 1.5), side * 2, widest}):
+        packed = pack_rectangles(sizes, candidate)
+        if packed is None:
+            continue
+        positions, height = packed
+        used_width = max(x + sizes[i][0] for i, (x, _) in enumerate(positions))
+        score = (max(used_width, height), used_width * height)
+        if best is None or score < best[0]:
+            best = (score, positions, used_width, height)
+    _, positions, width, height = best
+    return positions, width, height
+
+
+def collect_sprites(display_size=None):
+    """[(roster, person_id, avatar path, display size)] for every generated avatar, warning about missing ones."""
+    sprites = []
+    for roster, people in (("speakers", load_speakers()), ("organizers", load_organizers())):
+        output_dir, suffix = AVATAR_SOURCES[roster]
+        for person_id in people:
+            avatar_file = Path(output_dir) / f"{person_id}{suffix}"
+            if not avatar_file.exists():
+                print(f"✗ Missing avatar (run the avatar generators first): {avatar_file}")
+                continue
+            sprites.append((roster, person_id, avatar_file, display_size or DISPLAY_SIZES[roster]))
+    return sprites
+
+
+def render_sheet(sprites, positions, width, height, scale):
+    """Draw every avatar at scale x its display size into one opaque sheet on SHEET_BACKGROUND."""
+    sheet = Image.new("RGB", (width * scale, height * scale), SHEET_BACKGROUND)
+    for (_, _, avatar_file, size), (x, y) in zip(sprites, positions):
+        with Image.open(avatar_file) as avatar:
+            sprite = avatar.convert("RGBA").resize((size * scale, size * scale), Image.LANCZOS)
+        sheet.paste(sprite, ((x + PADDING) * scale, (y + PADDING) * scale), sprite)
+    return sheet
+
+
+def save_sheet(sheet, sheet_file, fmt):
+    """Encode a sheet with the responsive derivatives' settings for fmt. Returns bytes written."""
+    options = dict(ENCODERS[fmt])
+    sheet.save(sheet_file, options.pop("format"), **options)
+    return sheet_file.stat().st_size
+
+
+def write_data_file(atlas, path=DATA_FILE):
+    """Write the sprite map as a JS global next to speakers-config.js."""
+    body = json.dumps(atlas, indent=2, ensure_ascii=False)
+    Path(path).write_text(
+        "// Avatar sprite sheet coordinates, generated by generate_avatar_atlas.py - do not edit\n"
+        f"const avatarAtlas = {body};\n",
+        encoding="utf-8",
+    )
+
+
+def main(argv=None):
+    """Pack all generated avatars into 1x/2x AVIF and WebP sprite sheets plus a coordinate map."""
+    parser = argparse.ArgumentParser(description="Pack speaker and organizer avatars into a sprite sheet.")
+    parser.add_argument("--size", type=int, metavar="PX",
+                        help="display size in CSS pixels for every avatar "
+                             f"(default: {DISPLAY_SIZES['speakers']} for speakers, "
+                             f"{DISPLAY_SIZES['organizers']} for organizers, as on the website)")
+    args = parser.parse_args(argv)
+
+    # Create output directory
+    output_path = Path(OUTPUT_DIR)
+    output_path.mkdir(exist_ok=True)
+
+    sprites = collect_sprites(args.size)
+    if not sprites:
+        print("No avatars found - nothing to pack.")
+        return
+    print(f"Packing {len(sprites)} avatars into a sprite sheet...")
+
+    # Pack in CSS pixels; the 2x sheet uses the same layout at double resolution
+    sizes = [(size + 2 * PADDING, size + 2 * PADDING) for _, _, _, size in sprites]
+    positions, width, height = pack_atlas(sizes)
+    used = sum(w * h for w, h in sizes) / (width * height)
+    print(f"Sheet: {width}x{height} CSS pixels ({used:.0%} filled)")
+
+    # Sheets per format, in <source> preference order like the derivatives: {format: {"1x": path, "2x": path}}
+    atlas = {"width": width, "height": height, "sheets": {fmt: {} for fmt in OUTPUT_FORMATS},
+             "speakers": {}, "organizers": {}}
+    for scale in SCALES:
+        sheet = render_sheet(sprites, positions, width, height, scale)
+        for fmt in OUTPUT_FORMATS:
+            sheet_file = output_path / f"avatars@{scale}x.{fmt}"
+            size = save_sheet(sheet, sheet_file, fmt)
+            atlas["sheets"][fmt][f"{scale}x"] = sheet_file.as_posix()
+            print(f"✓ Generated: {sheet_file} ({size / 1024:.1f} KB)")
+
+    for (roster, person_id, _, size), (x, y) in zip(sprites, positions):
+        atlas[roster][person_id] = {"x": x + PADDING, "y": y + PADDING, "size": size}
+    write_data_file(atlas)
+
+    print(f"\nDone! Packed {len(sprites)} avatars into {OUTPUT_DIR}/ ({len(SCALES)} resolutions, "
+          f"{', '.join(OUTPUT_FORMATS)})")
+    print(f"Sprite coordinates written to {DATA_FILE}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Generate tiny placeholders for every speaker and organizer photo on the website.
+Each placeholder comes from the same center crop the avatar generators use, in two forms:
+- a BlurHash string, computed with NumPy as one pair of matrix products over the pixels;
+- a ~16 px WebP as a base64 data URI.
+Results are cached in .build_cache/ by the source photo's SHA-256. They are written
+to photo-placeholders.js, which prerender.py inlines behind each avatar, so cards show
+a blurred preview before the photos load without any extra request.
+"""
+
+import argparse
+import base64
+import io
+import json
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from batch import print_failure_summary
+from build_cache import CACHE_DIR, file_digest
+from photo_utils import add_crop_cache_arguments, configure_crop_cache, load_square_photo
+from roster import load_organizers, load_speakers
+from site_data import PLACEHOLDERS_FILE
+
+# Configuration
+DATA_FILE = PLACEHOLDERS_FILE
+CACHE_FILE = "placeholders.json"
+COMPONENTS = (4, 4)  # BlurHash components (x, y)
+SAMPLE_SIZE = 32  # BlurHash is computed on a SAMPLE_SIZE x SAMPLE_SIZE downscale of the crop
+PREVIEW_SIZE = 16  # Side of the WebP preview in pixels
+PREVIEW_QUALITY = 40
+PLACEHOLDER_VERSION = 1  # Bump when the placeholder method changes, so cached ones are recomputed
+
+BASE83 = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz#$%*+,-.:;=?@[]^_{|}~"
+
+
+def base83(value, length):
+    return "".join(BASE83[value // 83 ** (length - 1 - i) % 83] for i in range(length))
+
+
+def srgb_to_linear(values):
+    values = values / 255.0
+    return np.where(values <= 0.04045, values / 12.92, ((values + 0.055) / 1.055) ** 2.4)
+
+
+def linear_to_srgb(value):
+    value = min(max(value, 0.0), 1.0)
+    if value <= 0.0031308:
+        return int(value * 12.92 * 255 + 0.5)
+    return int((1.055 * value ** (1 / 2.4) - 0.055) * 255 + 0.5)
+
+
+def blurhash_factors(pixels, components=COMPONENTS):
+    """DCT factors [y component, x component, rgb] of an (h, w, 3) uint8 array, in linear light."""
+    components_x, components_y = components
+    height, width, _ = pixels.shape
+    linear = srgb_to_linear(pixels.astype(np.float64))
+    basis_x = np.cos(np.pi * np.outer(np.arange(components_x), np.arange(width)) / width)
+    basis_y = np.cos(np.pi * np.outer(np.arange(components_y), np.arange(height)) / height)
+    factors = np.einsum("jy,ix,yxc->jic", basis_y, basis_x, linear) / (width * height)
+    # Every AC component is doubled; the DC term is the plain average
+    normalisation = np.full((components_y, components_x, 1), 2.0)
+    normalisation[0, 0] = 1.0
+    return factors * normalisation
+
+
+def encode_blurhash(pixels, components=COMPONENTS):
+    """BlurHash string for an (h, w, 3) uint8 RGB array."""
+    components_x, components_y = components
+    factors = blurhash_factors(pixels, components)
+    dc = factors[0, 0]
+    ac = factors.reshape(-1, 3)[1:]
+
+    result = base83((components_x - 1) + (components_y - 1) * 9, 1)
+    if len(ac):
+        quantised_max = int(max(0, min(82, np.floor(np.abs(ac).max() * 166 - 0.5))))
+        maximum = (quantised_max + 1) / 166
+    else:
+        quantised_max, maximum = 0, 1.0
+    result += base83(quantised_max, 1)
+
+    r, g, b = (linear_to_srgb(value) for value in dc)
+    result += base83((r << 16) + (g << 8) + b, 4)
+
+    # AC values: sign-preserving square root, quantised to 19 levels per channel
+    scaled = np.sign(ac) * np.abs(ac / maximum) ** 0.5
+    quantised = np.clip(np.floor(scaled * 9 + 9.5), 0, 18).astype(int)
+    for qr, qg, qb in quantised:
+        result += base83(qr * 19 * 19 + qg * 19 + qb, 2)
+    return result
+
+
+def preview_data_uri(photo, size=PREVIEW_SIZE):
+    """A size x size WebP of the photo as a base64 data URI."""
+    buffer = io.BytesIO()
+    photo.resize((size, size), Image.LANCZOS).save(buffer, "WEBP", quality=PREVIEW_QUALITY, method=6)
+    return "data:image/webp;base64," + base64.b64encode(buffer.getvalue()).decode("ascii")
+
+
+def compute_placeholder(image_path):
+    """BlurHash, WebP data URI and average color of a photo's center crop."""
+    photo = load_square_photo(image_path, min_size=SAMPLE_SIZE)
+    sample = np.asarray(photo.resize((SAMPLE_SIZE, SAMPLE_SIZE), Image.BOX), dtype=np.uint8)
+    average = sample.reshape(-1, 3).mean(axis=0)
+    return {
+        "blurhash": encode_blurhash(sample),
+        "dataUri": preview_data_uri(photo),
+        "color": "#{:02x}{:02x}{:02x}".format(*(int(round(value)) for value in average)),
+    }
+
+
+def cache_key(digest):
+    return f"{digest}-v{PLACEHOLDER_VERSION}-{COMPONENTS[0]}x{COMPONENTS[1]}-{SAMPLE_SIZE}-{PREVIEW_SIZE}q{PREVIEW_QUALITY}"
+
+
+def load_cache(cache_dir=CACHE_DIR):
+    try:
+        return json.loads((Path(cache_dir) / CACHE_FILE).read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def save_cache(cache, cache_dir=CACHE_DIR):
+    path = Path(cache_dir) / CACHE_FILE
+    try:
+        path.parent.mkdir(exist_ok=True)
+        path.write_text(json.dumps(cache, indent=2, sort_keys=True))
+    except OSError as e:
+        print(f"Could not write placeholder cache: {e}")
+
+
+def write_data_file(entries, path=DATA_FILE):
+    """Write the placeholders, keyed by image path, as a JS global next to speakers-config.js."""
+    body = json.dumps(entries, indent=2, ensure_ascii=False, sort_keys=True)
+    Path(path).write_text(
+        "// Photo placeholders (BlurHash and tiny WebP), generated by generate_placeholders.py - do not edit\n"
+        f"const photoPlaceholders = {body};\n",
+        encoding="utf-8",
+    )
+
+
+def main(argv=None):
+    """Compute placeholders for every speaker and organizer photo."""
+    parser = argparse.ArgumentParser(description="Generate BlurHash and tiny WebP photo placeholders.")
+    parser.add_argument("--force", action="store_true", help="recompute every placeholder, ignoring the cache")
+    add_crop_cache_arguments(parser)
+    args = parser.parse_args(argv)
+    configure_crop_cache(args)
+
+    # Keyed by image path, not person id: a speaker and an organizer may share an id but not a photo
+    images = list(dict.fromkeys(person["image"] for roster in (load_speakers(), load_organizers())
+                                for person in roster.values()))
+    print(f"Generating placeholders for {len(images)} photos...")
+
+    cache = {} if args.force else load_cache()
+    entries = {}
+    computed = 0
+    failures = []
+    for image_path in images:
+        key = cache_key(file_digest(image_path))
+        try:
+            if key not in cache:
+                cache[key] = compute_placeholder(image_path)
+                computed += 1
+        except Exception as e:
+            failures.append((image_path, e))
+            continue
+        entries[image_path] = cache[key]
+        print(f"✓ {image_path}: {cache[key]['blurhash']} ({len(cache[key]['dataUri'])} byte data URI)")
+
+    # Keep only entries for current photos
+    save_cache({key: cache[key] for key in {cache_key(file_digest(image_path)) for image_path in images}
+                if key in cache})
+    write_data_file(entries)
+
+    print_failure_summary(failures)
+    print(f"\nDone! {len(entries)} placeholders in {DATA_FILE} ({computed} computed, {len(entries) - computed} cached)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Generate responsive photo derivatives for the Deep Matters: Foundations website.
+Each speaker and organizer photo is center-cropped and saved at 1x/2x/3x its card
+size in WebP (and AVIF where Pillow supports it), and responsive-images.js holds
+the srcset data that index.html uses instead of the full-size originals.
+"""
+
+from PIL import Image
+import argparse
+import hashlib
+import json
+import sys
+from pathlib import Path
+
+import photo_utils
+from batch import add_jobs_argument, print_failure_summary, run_tasks
+from build_cache import (add_cache_arguments, find_stale_outputs, is_fresh, load_manifest,
+                         output_key, report_stale, save_manifest)
+from photo_utils import add_crop_cache_arguments, configure_crop_cache, load_square_photo
+from roster import load_organizers, load_speakers
+from site_data import DISPLAY_SIZES, RESPONSIVE_FILE
+from tracing import add_profile_argument, finish_profile, span, start_profile
+
+# Configuration
+OUTPUT_DIR = "responsive_images"
+DATA_FILE = RESPONSIVE_FILE
+DENSITIES = (1, 2, 3)
+CACHE_FIELDS = ("image",)  # Derivatives only show the photo
+
+# Encoder settings per output format, in <source> preference order (browsers take the first match)
+ENCODERS = {
+    "avif": {"format": "AVIF", "quality": 60, "speed": 6},
+    "webp": {"format": "WEBP", "quality": 80, "method": 6},
+}
+
+Image.init()
+OUTPUT_FORMATS = [name for name, options in ENCODERS.items() if options["format"] in Image.SAVE]
+
+
+def derivative_widths(display_sizes, source_size):
+    """Widths to generate for the given display sizes, never upscaling past the source square."""
+    widths = sorted({size * density for size in display_sizes for density in DENSITIES})
+    return [width for width in widths if width <= source_size] or widths[:1]
+
+
+def derivative_path(name, width, fmt):
+    return Path(OUTPUT_DIR) / f"{name}-{width}w.{fmt}"
+
+
+def derivative_name(image_path, taken=()):
+    """Base name of a photo's derivatives: its file stem, plus a hash of its path if another photo has that stem."""
+    stem = Path(image_path).stem
+    if stem not in taken:
+        return stem
+    return f"{stem}-{hashlib.sha256(image_path.encode('utf-8')).hexdigest()[:8]}"
+
+
+def save_derivatives(name, image_path, widths, formats):
+    """Decode one photo once and write every width/format derivative (runs in a worker with --jobs)."""
+    with span("render", subject=name):
+        photo = load_square_photo(image_path, min_size=max(widths))
+        written = []
+        for width in widths:
+            with span("resize", size=width):
+                resized = photo.resize((width, width), Image.LANCZOS)
+            for fmt in formats:
+                options = dict(ENCODERS[fmt])
+                output_file = derivative_path(name, width, fmt)
+                with span("encode/write", file=output_file.name):
+                    resized.save(output_file, options.pop("format"), **options)
+                written.append(str(output_file))
+        return written
+
+
+def build_photos():
+    """Combine both rosters into {image_path: (derivative name, [display sizes])}.
+
+    Photos are keyed by path, not person id, so a speaker and an organizer with the same
+    id but different images each get their own derivatives.
+    """
+    photos = {}
+    for role, roster in (("speakers", load_speakers()), ("organizers", load_organizers())):
+        for person in roster.values():
+            image_path = person["image"]
+            if image_path not in photos:
+                taken = {name for name, _ in photos.values()}
+                photos[image_path] = (derivative_name(image_path, taken), [])
+            photos[image_path][1].append(DISPLAY_SIZES[role])
+    return photos
+
+
+def srcset_entry(name, image_path, widths, formats):
+    """srcset data for one photo, as used by prerender.py."""
+    return {
+        "src": image_path,
+        "widths": widths,
+        "srcset": {
+            fmt: ", ".join(f"{derivative_path(name, width, fmt).as_posix()} {width}w" for width in widths)
+            for fmt in formats
+        },
+    }
+
+
+def write_data_file(entries, path=DATA_FILE):
+    """Write the srcset data, keyed by image path, as a JS global next to speakers-config.js."""
+    body = json.dumps(entries, indent=2, ensure_ascii=False)
+    Path(path).write_text(
+        "// Responsive photo derivatives, generated by generate_responsive_images.py - do not edit\n"
+        f"const responsiveImages = {body};\n",
+        encoding="utf-8",
+    )
+
+
+def main(argv=None):
+    """Generate responsive derivatives for every speaker and organizer photo."""
+    parser = argparse.ArgumentParser(description="Generate responsive WebP/AVIF photo derivatives.")
+    add_cache_arguments(parser)
+    add_crop_cache_arguments(parser)
+    add_jobs_argument(parser)
+    add_profile_argument(parser)
+    args = parser.parse_args(argv)
+    start_profile(args)
+    configure_crop_cache(args)
+
+    # Create output directory
+    output_path = Path(OUTPUT_DIR)
+    output_path.mkdir(exist_ok=True)
+
+    photos = build_photos()
+    print(f"Generating responsive derivatives for {len(photos)} photos...")
+    print(f"Output directory: {output_path.absolute()}")
+    print(f"Formats: {', '.join(OUTPUT_FORMATS)}\n")
+
+    manifest = load_manifest()
+    this_module = sys.modules[__name__]
+    entries = {}
+    pending = []
+    failures = []
+    skipped = 0
+    for image_path, (name, sizes) in photos.items():
+        try:
+            # Header-only read: the source size decides which widths are worth generating
+            with Image.open(image_path) as header:
+                source_size = min(header.size)
+        except Exception as e:
+            failures.append((image_path, e))
+            continue
+        widths = derivative_widths(sizes, source_size)
+        entries[image_path] = srcset_entry(name, image_path, widths, OUTPUT_FORMATS)
+
+        key = output_key(this_module, {"image": image_path}, [image_path, __file__, photo_utils.__file__])
+        outputs = [derivative_path(name, width, fmt) for width in widths for fmt in OUTPUT_FORMATS]
+        if not args.force and all(is_fresh(manifest, output_file, key) for output_file in outputs):
+            skipped += 1
+        else:
+            pending.append((name, image_path, widths, key))
+
+    tasks = [(name, image_path, widths, OUTPUT_FORMATS) for name, image_path, widths, _ in pending]
+    generated = 0
+    for (name, image_path, _, key), (written, error) in zip(pending, run_tasks(save_derivatives, tasks, args.jobs)):
+        if error is None:
+            for output_file in written:
+                manifest[output_file] = key
+            generated += 1
+            print(f"✓ Generated: {len(written)} derivatives - {name}")
+        else:
+            entries.pop(image_path, None)
+            failures.append((image_path, error))
+
+    expected = [derivative_path(photos[image_path][0], width, fmt)
+                for image_path, entry in entries.items() for width in entry["widths"] for fmt in OUTPUT_FORMATS]
+    for fmt in OUTPUT_FORMATS:
+        report_stale(find_stale_outputs(output_path, f".{fmt}", expected), manifest, prune=args.prune)
+    save_manifest(manifest)
+    write_data_file(entries)
+
+    print_failure_summary(failures)
+    print(f"\nDone! Generated derivatives for {generated} photos in {OUTPUT_DIR}/ ({skipped} unchanged, skipped)")
+    print(f"srcset data written to {DATA_FILE}")
+
+    finish_profile(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Memory budget (--max-memory) for the Deep Matters image generators.
+Each task's peak footprint is estimated from its photo's header before anything
+is decoded (the size libjpeg's draft mode will produce, plus the output canvases),
+and the batch runners only start a task while the tasks in flight still fit the
+budget. Peak RSS is reported at the end so estimates can be checked against reality.
+"""
+
+import argparse
+import os
+import resource
+import sys
+
+from PIL import Image
+
+from photo_utils import draft_size
+
+# Cost model
+BYTES_PER_PIXEL = 4  # Pillow stores RGB and RGBA pixels in 4 bytes
+DECODE_COPIES = 2  # decoded frame plus its RGB conversion
+CANVAS_COPIES = 3  # template copy, composited layers and the encoder's working copy
+
+SIZE_UNITS = {"": 1, "K": 1024, "M": 1024 ** 2, "G": 1024 ** 3, "T": 1024 ** 4}
+
+
+def parse_size(text):
+    """Parse a size such as 2G, 512M or 1.5GB into bytes (argparse type)."""
+    value = text.strip().upper().removesuffix("B").removesuffix("I")
+    unit = value[-1:] if value[-1:] in SIZE_UNITS else ""
+    try:
+        size = float(value[:len(value) - len(unit)]) * SIZE_UNITS[unit]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid size: {text!r} (use e.g. 512M or 2G)")
+    if size <= 0:
+        raise argparse.ArgumentTypeError(f"size must be positive: {text!r}")
+    return int(size)
+
+
+def format_size(size):
+    return f"{size / (1024 * 1024):.0f} MB"
+
+
+def add_memory_argument(parser):
+    """Add the shared --max-memory option to a generator's argument parser."""
+    parser.add_argument("--max-memory", type=parse_size, metavar="SIZE",
+                        help="limit photos decoded and images held at once to fit in SIZE (e.g. 2G), "
+                             "estimated from image headers, and report peak memory")
+
+
+def decoded_size(image_path, min_size=None):
+    """(width, height) a photo will decode at, read from its header without decoding pixels."""
+    with Image.open(image_path) as img:
+        if min_size and img.format == "JPEG":
+            img.draft("RGB", draft_size(*img.size, min_size))
+        return img.size
+
+
+def estimate_cost(image_path, min_size=None, canvases=()):
+    """Estimated peak bytes for decoding one photo and rendering the (width, height) canvases from it."""
+    try:
+        width, height = decoded_size(image_path, min_size)
+    except OSError:
+        # Missing or unreadable photos fail (or fall back) before decoding anything large
+        width = height = 0
+    side = min(width, height)
+    pixels = width * height * DECODE_COPIES + side * side
+    pixels += sum(w * h for w, h in canvases) * CANVAS_COPIES
+    return pixels * BYTES_PER_PIXEL
+
+
+def current_rss():
+    """Resident set size of this process in bytes (peak RSS where /proc is unavailable)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return peak_rss()[0]
+
+
+def peak_rss():
+    """Peak RSS in bytes of this process and of the largest finished worker process."""
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    scale = 1 if sys.platform == "darwin" else 1024
+    return (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale,
+            resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * scale)
+
+
+def task_budget(max_memory, processes=1):
+    """Bytes left for in-flight tasks once every process's baseline (interpreter, Pillow, fonts) is paid for."""
+    budget = max_memory - current_rss() * processes
+    if budget <= 0:
+        print(f"Memory budget {format_size(max_memory)} is below the baseline of {processes} process(es); "
+              "rendering one photo at a time")
+    return max(budget, 0)
+
+
+class MemoryBudget:
+    """Running total of the estimated bytes held by in-flight tasks.
+
+    A task fits if it stays under the limit, or if nothing else is in flight
+    (so one oversized photo still renders instead of stalling the batch).
+    """
+
+    def __init__(self, limit=None):
+        self.limit = limit
+        self.in_flight = 0
+
+    def fits(self, cost):
+        return self.limit is None or self.in_flight == 0 or self.in_flight + cost <= self.limit
+
+    def acquire(self, cost):
+        self.in_flight += cost
+
+    def release(self, cost):
+        self.in_flight -= cost
+
+
+def print_peak_memory(args):
+    """With --max-memory, report peak RSS against the budget."""
+    if not getattr(args, "max_memory", None):
+        return
+    main_peak, worker_peak = peak_rss()
+    line = f"\nPeak memory: {format_size(main_peak)}"
+    if worker_peak and getattr(args, "jobs", 1) != 1:
+        line += f" (largest worker: {format_size(worker_peak)})"
+    print(f"{line}, budget {format_size(args.max_memory)}")
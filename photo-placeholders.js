@@ -0,0 +1,48 @@
+// Photo placeholders (BlurHash and tiny WebP), generated by generate_placeholders.py - do not edit
+const photoPlaceholders = {
+  "images/francesco-ferroni.jpg": {
+    "blurhash": "UEEyD8xv5+^+~UR*pIxa9vM{R5V@tSt7xaxt",
+    "color": "#726d6a",
+    "dataUri": "data:image/webp;base64,UklGRnoAAABXRUJQVlA4IG4AAAAQAgCdASoQABAAA4BaJYwCdAYxZdzd7MZAAPZn0+k2SbGnXmMUfZ7GkmuMz40+asv5LJyO707IaLeyiIgGK8z+rXqsgk0eWVFNTeyGuGNs+Wg2ZovzuZ4mhPCBgFt7kJ0NoZmasLRl6YWm+fAAAA=="
+  },
+  "images/hassan-sirelkhatim.jpeg": {
+    "blurhash": "UVAAqCWBR,t7DgofkCayxwayaeWVR%fQofay",
+    "color": "#4a4e5a",
+    "dataUri": "data:image/webp;base64,UklGRloAAABXRUJQVlA4IE4AAACwAQCdASoQABAAA4BaJQBdgCHGgtDAAP7zC7JNwNfdPKTOA+sad4c9xVjFtY4UBFLHBvnxZX2u2MdDlGqkaMxH+kjmr8m1EMi4TXm3QAA="
+  },
+  "images/james-gin.jpg": {
+    "blurhash": "UXFPdF.9-:nlI7R5o#WFERM{Mwt8%M%MxujX",
+    "color": "#767c85",
+    "dataUri": "data:image/webp;base64,UklGRnwAAABXRUJQVlA4IHAAAAAQAgCdASoQABAAA4BaJbACdAYxjgJcpW+IAP0pNf0fIF+KYkRYi6sZeXTf9zkVXKJRWvoOSCNx6hdt5bCqF83yHIF9of9LbqqzJF0rKMZnvrzUK7Y7GnRKGK/veWjOX5cDLHoTFuiz/+tCQAi0UAAA"
+  },
+  "images/lei-ge.JPG": {
+    "blurhash": "UrJRgi_4b_%hWFozt7aK.9R%ROxakDofWBay",
+    "color": "#929192",
+    "dataUri": "data:image/webp;base64,UklGRoYAAABXRUJQVlA4IHoAAAAwAgCdASoQABAAA4BaJQBOgCMCp2pK5R+UAAD+84H0qk55O09KTFDpcAIz944cNnboFPKrVwvzC+mIwBfomZzJsXA3yMb5o7eL6X6TozVxp6Hs8TGRIqIocmxFFAqBsnXRb5xVgK1lk7zeVWt4c1BdfOlAb5phC1wAAA=="
+  },
+  "images/peter-coveney.jpg": {
+    "blurhash": "UHDJ3N^+tlNw~VMxI;NIM{WBoLxuE2ozi^s9",
+    "color": "#635d5c",
+    "dataUri": "data:image/webp;base64,UklGRlwAAABXRUJQVlA4IFAAAADQAQCdASoQABAAA4BaJYwCw7DaxfU3AAD+MZK7LaW0d1Y3sV5ysC4fd+AuyOOYxPnwLtG43pr18MPf2NHqo1NNIgefHkTt2hUiLQ6uRingAA=="
+  },
+  "images/ronan-docherty.jpg": {
+    "blurhash": "UFFY7G~pC7EM~T%Mtks.9[xur?xaxu%2RktS",
+    "color": "#74645b",
+    "dataUri": "data:image/webp;base64,UklGRooAAABXRUJQVlA4IH4AAACQAgCdASoQABAAA4BaJYgCdAYt925HBCcKvnuAAAD839ORHDDwiqBq0Ub7csrATgKyHB5QAazav19XMJeIIV0UYeNpP679fFO2Tu1+3+eFIQWscBuyvh1i1+Ito3BXTW7VHd/WjCSgFknxqXwkweEPSIlcj5BRVImUx7IAAAA="
+  },
+  "images/samuel-cooper.jpg": {
+    "blurhash": "UEHUth?aC8Sh~pay4.WC5SaxZ~jFpHkC-TWC",
+    "color": "#83797a",
+    "dataUri": "data:image/webp;base64,UklGRoQAAABXRUJQVlA4IHgAAABQAgCdASoQABAAA4BaJQBOj+ACzCxwi60R6kAA/C2fBOpjfY1/EanB4ovI+0U3zJvqGPntePpy5cP6nG6XiKbRlEuGAMG2jA9ABQoq3qd0HRw0kH7vfFnXLZZY0SLAx4d+UCRw9ETXsJmp7xf70Z2SvriniAtOAAA="
+  },
+  "images/sina-samangooei.jpg": {
+    "blurhash": "UVKBBu8_Xn~q^+WUxu%MbvWVn$D%%MRjs:Rj",
+    "color": "#9f9a98",
+    "dataUri": "data:image/webp;base64,UklGRnoAAABXRUJQVlA4IG4AAABQAgCdASoQABAAA4BaJZQC7AYvrq/pZw09uAAA/tXrpR9/DKBmeab/XcKdngGsRaIuDBzpqd+uXSgxT2K7SMzKlV7rbd/j0i5WHHCcr6WEPENmpDUZqANho0LCeNieNQl+eeWSTSKXwdgJEIAAAA=="
+  },
+  "images/steven-kench.jpg": {
+    "blurhash": "UbH_9|-:-mxt},oxNeWCE2V@aejZS2s+xDax",
+    "color": "#827c6f",
+    "dataUri": "data:image/webp;base64,UklGRn4AAABXRUJQVlA4IHIAAAAwAgCdASoQABAAA4BaJbACdAYww8zwendtQAD+Z9tueu2fKing0Fhy/XdyuDn9/OiIJm0ZQbC/D+gSSFuw6+ZqPfbq1p4zlCEYQtGefyU1ipW8ZmI27qiHsF+zCOyJIc7l/eNTbdtFaKsYeZy7neyAAAA="
+  }
+};
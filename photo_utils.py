@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Shared photo loading for the Deep Matters: Foundations image generators.
+Each source photo is decoded and center-cropped to a square once, so every
+output format (avatar, landscape card, square card) can reuse the same pixels.
+
+Center crops are also kept on disk at a few standard sizes, as raw RGB files
+keyed by the source's SHA-256, so later runs (e.g. after a layout change) read
+them back in instead of decoding multi-megabyte JPEGs again.
+"""
+
+import math
+import os
+from pathlib import Path
+
+from PIL import Image
+
+from build_cache import CACHE_DIR, file_digest
+from tracing import span
+
+# Persistent crop cache: uncompressed RGB squares in .build_cache/crops/
+CROP_CACHE_DIR = os.path.join(CACHE_DIR, "crops")
+CROP_SIZES = (256, 512, 1024)  # Standard square sizes kept on disk
+CROP_CACHE_MB = 512  # Least recently used crops are evicted above this size
+CROP_CACHE_LOW_WATER = 0.8  # Eviction trims the cache to this fraction of its budget, so it runs rarely
+CROP_VERSION = 1  # Bump when the crop or resize method changes, so old crops are never reused
+
+CROP_CACHE = {"enabled": True, "max_bytes": CROP_CACHE_MB * 1024 * 1024}
+
+# Running size of the crop cache in this process (None until the first write scans it)
+_cache_usage = {"bytes": None}
+
+
+def center_square_box(width, height):
+    """Return the crop box of the largest centered square in a width x height image."""
+    min_dim = min(width, height)
+    left = (width - min_dim) // 2
+    top = (height - min_dim) // 2
+    return (left, top, left + min_dim, top + min_dim)
+
+
+def draft_size(width, height, min_size):
+    """Smallest (width, height) whose centered square is still at least min_size pixels."""
+    scale = min_size / min(width, height)
+    return (math.ceil(width * scale), math.ceil(height * scale))
+
+
+def add_crop_cache_arguments(parser):
+    """Add the shared crop cache options to a generator's argument parser."""
+    parser.add_argument("--clear-cache", action="store_true",
+                        help=f"delete the cached photo crops in {CROP_CACHE_DIR}/ before running")
+    parser.add_argument("--no-crop-cache", action="store_true",
+                        help="decode every photo from its original instead of the cached crops (add --force to re-render)")
+    parser.add_argument("--crop-cache-mb", type=int, default=CROP_CACHE_MB, metavar="MB",
+                        help=f"disk budget for cached crops (default: {CROP_CACHE_MB})")
+
+
+def configure_crop_cache(args):
+    """Apply the parsed crop cache options, clearing the cache first if asked."""
+    CROP_CACHE["enabled"] = not args.no_crop_cache
+    CROP_CACHE["max_bytes"] = args.crop_cache_mb * 1024 * 1024
+    if args.clear_cache:
+        removed, freed = clear_crop_cache()
+        print(f"Cleared crop cache: {removed} files, {freed / (1024 * 1024):.1f} MB")
+
+
+def with_crop_cache(options, func, *args):
+    """Run func(*args) with the parent's CROP_CACHE options (in a --jobs worker, which may start from the defaults)."""
+    CROP_CACHE.update(options)
+    return func(*args)
+
+
+def crop_level(min_size):
+    """Smallest standard crop size covering min_size, or None if it is larger than all of them."""
+    return next((size for size in CROP_SIZES if size >= min_size), None)
+
+
+def crop_cache_path(digest, size):
+    return Path(CROP_CACHE_DIR) / f"{digest[:32]}-center-v{CROP_VERSION}-{size}.rgb"
+
+
+def read_cached_crop(path):
+    """Read a cached raw RGB square back into an image, or None if it is missing or truncated.
+
+    The side is implied by the file length (sources smaller than the level are stored at their own size).
+    """
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return None
+    side = math.isqrt(len(data) // 3)
+    if side == 0 or side * side * 3 != len(data):
+        return None
+    img = Image.frombytes("RGB", (side, side), data)
+    # Mark as recently used for eviction (best effort: the cache may be read-only)
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+    return img
+
+
+def write_cached_crop(path, img):
+    """Store a crop as raw RGB (written atomically), evicting the oldest crops once the cache is over budget.
+
+    The cache size is tracked as a running total, so it is only scanned on the first write and on eviction.
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = img.tobytes()
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+        if _cache_usage["bytes"] is None:
+            _cache_usage["bytes"] = evict_crops(None)
+        else:
+            _cache_usage["bytes"] += len(data)
+        if _cache_usage["bytes"] > CROP_CACHE["max_bytes"]:
+            _cache_usage["bytes"] = evict_crops(int(CROP_CACHE["max_bytes"] * CROP_CACHE_LOW_WATER))
+    except OSError as e:
+        print(f"Could not write crop cache: {e}")
+
+
+def evict_crops(max_bytes):
+    """Delete least recently used crops until the cache fits in max_bytes (None only measures it).
+
+    Returns the size of the crops left.
+    """
+    entries = []
+    for path in Path(CROP_CACHE_DIR).glob("*.rgb"):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        entries.append((stat.st_mtime_ns, stat.st_size, path))
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if max_bytes is None or total <= max_bytes:
+            break
+        path.unlink(missing_ok=True)
+        total -= size
+    return total
+
+
+def clear_crop_cache():
+    """Delete every cached crop. Returns (files removed, bytes freed)."""
+    removed = freed = 0
+    for path in Path(CROP_CACHE_DIR).glob("*.rgb"):
+        freed += path.stat().st_size
+        path.unlink()
+        removed += 1
+    _cache_usage["bytes"] = 0
+    return removed, freed
+
+
+def decode_square_photo(image_path, min_size=None):
+    """Open an image, convert it to RGB and crop it to a centered square.
+
+    With min_size, JPEGs are decoded in draft mode: libjpeg scales them down by
+    1/2, 1/4 or 1/8 in the DCT domain, picking the smallest scale whose square is
+    still at least min_size. Other formats fall back to a full decode.
+    """
+    with span("decode", path=str(image_path)):
+        with Image.open(image_path) as source:
+            if min_size and source.format == "JPEG":
+                source.draft("RGB", draft_size(*source.size, min_size))
+            img = source.convert("RGB")
+    with span("crop", size=f"{img.width}x{img.height}"):
+        square = img.crop(center_square_box(*img.size))
+    # Free the full decoded frame now rather than when the caller's frame unwinds
+    img.close()
+    return square
+
+
+def load_square_photo(image_path, min_size=None):
+    """Centered RGB square of a photo, at least min_size pixels when the source allows.
+
+    With min_size, the crop comes from the persistent cache at the smallest standard
+    size covering it, or the full crop for smaller sources (decoding and storing it
+    on a miss), so hits and misses return identical pixels. Sizes above the largest
+    standard one are decoded directly.
+    """
+    level = crop_level(min_size) if min_size and CROP_CACHE["enabled"] else None
+    if level is None:
+        return decode_square_photo(image_path, min_size)
+
+    path = crop_cache_path(file_digest(image_path), level)
+    with span("crop cache", size=level):
+        img = read_cached_crop(path)
+    if img is not None:
+        return img
+
+    img = decode_square_photo(image_path, level)
+    if img.width > level:
+        with span("resize", size=level):
+            img = img.resize((level, level), Image.LANCZOS)
+    write_cached_crop(path, img)
+    return img
+
+
+def as_square_photo(source, min_size=None):
+    """Return a square RGB photo from either a file path or an already-cropped image."""
+    if isinstance(source, Image.Image):
+        return source
+    return load_square_photo(source, min_size=min_size)
+
+
+class PhotoPyramid:
+    """A decoded square photo plus successively halved copies of it.
+
+    Every photo slot is resized from the smallest level that is still at least
+    as large as the slot, so extra output formats reuse one decode and never
+    resample the full-resolution crop more than once. Resized slots are memoized.
+    """
+
+    def __init__(self, photo, min_size=1):
+        self.levels = [photo]
+        while self.levels[-1].width // 2 >= min_size:
+            with span("pyramid", size=self.levels[-1].width // 2):
+                self.levels.append(self.levels[-1].reduce(2))
+        self._resized = {}
+
+    def level_for(self, size):
+        """Smallest level whose side is at least size (the largest one if none is)."""
+        return min((level for level in self.levels if level.width >= size),
+                   key=lambda level: level.width, default=self.levels[0])
+
+    def resized(self, size):
+        """size x size photo, resampled with LANCZOS from the nearest larger level."""
+        if size not in self._resized:
+            with span("resize", size=size):
+                self._resized[size] = self.level_for(size).resize((size, size), Image.LANCZOS)
+        return self._resized[size]
+
+
+def photo_at(source, size):
+    """size x size square photo from a file path, an already-cropped square image or a PhotoPyramid."""
+    if isinstance(source, PhotoPyramid):
+        return source.resized(size)
+    img = as_square_photo(source, min_size=size)
+    with span("resize", size=size):
+        return img.resize((size, size), Image.LANCZOS)
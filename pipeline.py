@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Bounded read/decode -> render -> encode/write pipeline for the Deep Matters image generators.
+Upcoming photos are opened and decoded on a small thread pool while the current
+card renders, and finished images are encoded and written in the background.
+Pillow releases the GIL while decoding, resizing and compressing, so file I/O
+(slow on network-mounted photo directories), rendering and encoding overlap.
+Queue depths bound how many decoded photos and unwritten images are held at once,
+and --max-memory additionally holds back prefetching while the estimated footprint
+of the photos and images in flight would exceed the budget.
+"""
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from batch import resolve_jobs, run_tasks
+from memory import MemoryBudget, add_memory_argument, format_size, task_budget
+from tracing import span
+
+# Default queue depths and I/O thread count
+PREFETCH_DEPTH = 4  # decoded photos held ahead of the renderer
+WRITE_QUEUE_DEPTH = 4  # rendered images waiting to be encoded and written
+IO_THREADS = 2  # threads for each of the prefetch and writer stages
+
+
+def add_pipeline_arguments(parser):
+    """Add the shared --prefetch / --write-queue / --io-threads options to a generator's argument parser."""
+    parser.add_argument("--prefetch", type=int, default=PREFETCH_DEPTH, metavar="N",
+                        help=f"photos to read and decode ahead of rendering (default: {PREFETCH_DEPTH})")
+    parser.add_argument("--write-queue", type=int, default=WRITE_QUEUE_DEPTH, metavar="N",
+                        help=f"rendered images to buffer for background encoding (default: {WRITE_QUEUE_DEPTH})")
+    parser.add_argument("--io-threads", type=int, default=IO_THREADS, metavar="N",
+                        help=f"threads for each of the decode and write stages (default: {IO_THREADS})")
+    add_memory_argument(parser)
+
+
+def pipeline_options(args):
+    """Keyword arguments for run_pipeline() from parsed pipeline options."""
+    return {
+        "prefetch": max(1, args.prefetch),
+        "write_queue": max(1, args.write_queue),
+        "io_threads": max(1, args.io_threads),
+    }
+
+
+def _load(load, task, subject):
+    try:
+        with span("prefetch", subject=subject):
+            return load(*task), None
+    except Exception as e:
+        return None, e
+
+
+def _write(write, task, image, subject):
+    with span("write", subject=subject):
+        return write(task, image)
+
+
+def run_pipeline(tasks, load, render, write, prefetch=PREFETCH_DEPTH, write_queue=WRITE_QUEUE_DEPTH,
+                 io_threads=IO_THREADS, subject=None, costs=None, max_memory=None):
+    """Run load -> render -> write for every task, yielding (result, error) pairs in task order.
+
+    load(*task) reads and decodes on a prefetch thread, render(task, loaded, load_error)
+    runs on the calling thread, and write(task, image) encodes and saves on a writer
+    thread; its return value is the task's result. render decides what a failed load
+    means (e.g. re-raise it, or fall back to rendering from the file path).
+    subject(task) names the task in --profile traces. With costs (estimated bytes per
+    task) and max_memory, a task is only prefetched while the tasks between prefetch
+    and a finished write fit in max_memory.
+    """
+    subject = subject or (lambda task: None)
+    tasks = list(tasks)
+    costs = costs or [0] * len(tasks)
+    budget = MemoryBudget(max_memory)
+    with ThreadPoolExecutor(max_workers=io_threads, thread_name_prefix="prefetch") as loaders, \
+            ThreadPoolExecutor(max_workers=io_threads, thread_name_prefix="writer") as writers:
+        loading = deque()
+        writing = deque()
+        next_task = 0
+
+        def fill_prefetch():
+            nonlocal next_task
+            while next_task < len(tasks) and len(loading) < prefetch and budget.fits(costs[next_task]):
+                loading.append(loaders.submit(_load, load, tasks[next_task], subject(tasks[next_task])))
+                budget.acquire(costs[next_task])
+                next_task += 1
+
+        def finished():
+            item, cost = writing.popleft()
+            budget.release(cost)
+            if isinstance(item, Exception):
+                return None, item
+            try:
+                return item.result(), None
+            except Exception as e:
+                return None, e
+
+        fill_prefetch()
+        for index, task in enumerate(tasks):
+            # Over budget: finish writes (releasing their images) until this task's photo can be loaded
+            while not loading:
+                if writing:
+                    yield finished()
+                fill_prefetch()
+            with span("wait for decode"):
+                loaded, load_error = loading.popleft().result()
+            fill_prefetch()
+            try:
+                with span("render", subject=subject(task)):
+                    image = render(task, loaded, load_error)
+            except Exception as e:
+                writing.append((e, costs[index]))
+            else:
+                writing.append((writers.submit(_write, write, task, image, subject(task)), costs[index]))
+            loaded = image = None
+
+            # Bound the images held in memory: wait for the oldest write before rendering more
+            while len(writing) >= write_queue:
+                yield finished()
+
+        while writing:
+            yield finished()
+
+
+def run_stages(tasks, args, worker, load, render, write, subject=None, cost=None):
+    """Run a generator's tasks: worker(*task) on a process pool with --jobs N > 1,
+    otherwise load/render/write through the threaded pipeline. Yields (result, error) in task order.
+
+    With --max-memory, cost(*task) estimates a task's peak bytes from image headers.
+    """
+    jobs = resolve_jobs(args.jobs)
+    costs = max_memory = None
+    if getattr(args, "max_memory", None) and cost is not None and tasks:
+        costs = [cost(*task) for task in tasks]
+        # Worker processes each pay the interpreter baseline; the pipeline shares this process
+        max_memory = task_budget(args.max_memory, jobs + 1 if jobs > 1 else 1)
+        if max_memory:
+            print(f"Memory budget: {format_size(max_memory)} for in-flight work "
+                  f"(largest task ~{format_size(max(costs))}, estimated from image headers)")
+    if jobs > 1:
+        return run_tasks(worker, tasks, args.jobs, costs=costs, max_memory=max_memory)
+    return run_pipeline(tasks, load, render, write, subject=subject, costs=costs, max_memory=max_memory,
+                        **pipeline_options(args))
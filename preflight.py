@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Preflight check of every image the Deep Matters generators and website use.
+Photos and logos from speakers-config.js and organizers-config.js, the conference
+logo and the images index.html references are checked on a thread pool. Only file
+headers are read (format, size, mode, EXIF orientation), never the pixels, so all of
+them are checked in a fraction of a second before a batch starts. It reports:
+- missing or unreadable files;
+- paths whose case differs from the file on disk (works on macOS, breaks on Linux CI);
+- photos smaller than the largest format needs, and JPEGs with EXIF rotation;
+- content that does not match the extension, and people without an affiliation logo.
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from PIL import Image
+
+import card_layouts
+from build_dist import ENTRY_PAGES, find_references
+from roster import AFFILIATION_LOGOS, load_organizers, load_speakers
+
+# Configuration
+THREADS = 8
+EXIF_ORIENTATION = 0x0112
+IMAGE_EXTENSIONS = {".jpg": "JPEG", ".jpeg": "JPEG", ".png": "PNG", ".webp": "WEBP", ".avif": "AVIF",
+                    ".gif": "GIF"}
+
+
+def case_mismatch(path):
+    """The on-disk spelling of path if some component differs only in case, else None."""
+    parts = Path(path).parts
+    current = Path(".")
+    for index, part in enumerate(parts):
+        try:
+            names = os.listdir(current)
+        except OSError:
+            return None
+        if part not in names:
+            matches = [name for name in names if name.casefold() == part.casefold()]
+            if not matches:
+                return None
+            return Path(current, matches[0], *parts[index + 1:]).as_posix()
+        current = current / part
+    return None
+
+
+def check_image(path, photo_sizes=None):
+    """Header-only checks of one image, with photo_sizes {format: px} for photos.
+
+    Returns [(level, message)] with level "error" or "warning".
+    """
+    problems = []
+    actual = case_mismatch(path)
+    if actual:
+        problems.append(("error", f"case mismatch: file on disk is {actual}"))
+    if not os.path.exists(path):
+        if not actual:
+            problems.append(("error", "missing"))
+        return problems
+
+    try:
+        with Image.open(path) as img:
+            fmt, (width, height), mode = img.format, img.size, img.mode
+            orientation = img.getexif().get(EXIF_ORIENTATION, 1) if fmt == "JPEG" else 1
+    except Exception as e:
+        problems.append(("error", f"unreadable: {e}"))
+        return problems
+
+    expected = IMAGE_EXTENSIONS.get(Path(path).suffix.lower())
+    if expected and fmt != expected:
+        problems.append(("warning", f"{fmt} content with a {Path(path).suffix} extension"))
+    if orientation not in (1, None):
+        problems.append(("warning", f"EXIF orientation {orientation}: generators ignore it, so it renders rotated"))
+    upscaled = [f"{name} ({size}px)" for name, size in (photo_sizes or {}).items() if size > min(width, height)]
+    if upscaled:
+        problems.append(("warning", f"{width}x{height} {mode}: upscaled for {', '.join(upscaled)}"))
+    return problems
+
+
+def collect_assets(formats):
+    """({path: {format: photo size}}, [(level, person, message)] for config problems)."""
+    assets = {}
+    notes = []
+    rosters = {"speakers": load_speakers(), "organizers": load_organizers()}
+    for roster, people in rosters.items():
+        photo_sizes = {name: spec["photo_size"] for name, spec in formats.items() if spec["roster"] == roster}
+        for person_id, person in people.items():
+            if not person.get("image"):
+                notes.append(("error", f"{roster}/{person_id}", "no image in config"))
+                continue
+            assets.setdefault(person["image"], {}).update(photo_sizes)
+            if person.get("logo"):
+                assets.setdefault(person["logo"], {})
+            elif roster == "speakers":
+                notes.append(("warning", f"{roster}/{person_id}",
+                              f"no affiliation logo for {person.get('affiliation')!r} "
+                              "(add one to roster.AFFILIATION_LOGOS or a logo field in the config)"))
+
+    assets.setdefault(card_layouts.CONFERENCE_LOGO, {})
+    for path in AFFILIATION_LOGOS.values():
+        assets.setdefault(path, {})
+    for page in ENTRY_PAGES:
+        for path in find_references(Path(page).read_text(encoding="utf-8")):
+            if Path(path).suffix.lower() in IMAGE_EXTENSIONS:
+                assets.setdefault(path, {})
+    return assets, notes
+
+
+def check_assets(formats, threads=THREADS):
+    """Check every referenced image in parallel.
+
+    Returns ([(level, path or person, message)] with errors first, number of images checked).
+    """
+    assets, notes = collect_assets(formats)
+    with ThreadPoolExecutor(max_workers=threads, thread_name_prefix="preflight") as pool:
+        results = pool.map(lambda item: (item[0], check_image(*item)), assets.items())
+        problems = [(level, path, message) for path, found in results for level, message in found]
+    problems += notes
+    return sorted(problems, key=lambda problem: problem[0] != "error"), len(assets)
+
+
+def print_report(problems, checked, elapsed):
+    errors = sum(1 for level, _, _ in problems if level == "error")
+    for level, subject, message in problems:
+        print(f"{'✗' if level == 'error' else '!'} {subject}: {message}")
+    print(f"Preflight: {checked} images checked in {elapsed * 1000:.0f} ms - "
+          f"{errors} errors, {len(problems) - errors} warnings")
+    return errors
+
+
+def run_preflight(formats, threads=THREADS):
+    """Check and report; True when there are no errors."""
+    start = time.perf_counter()
+    problems, checked = check_assets(formats, threads)
+    return print_report(problems, checked, time.perf_counter() - start) == 0
+
+
+def main(argv=None):
+    """Check every referenced image, exiting non-zero on errors (or warnings with --strict)."""
+    # Imported here because render_engine runs the preflight itself before rendering
+    from render_engine import FORMATS
+
+    parser = argparse.ArgumentParser(description="Check all referenced photos and logos without decoding them.")
+    parser.add_argument("--strict", action="store_true", help="fail on warnings too")
+    parser.add_argument("--threads", type=int, default=THREADS, metavar="N",
+                        help=f"files to check at once (default: {THREADS})")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    problems, checked = check_assets(FORMATS, max(1, args.threads))
+    errors = print_report(problems, checked, time.perf_counter() - start)
+    if errors or (args.strict and problems):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
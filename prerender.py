@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Prerender the config-driven parts of index.html for Deep Matters: Foundations.
+The speaker and organizer grids and the talk rows of the schedule are built from
+speakers-config.js and organizers-config.js at build time. Avatars use the sprite
+atlas or the responsive derivatives, with explicit width/height, over an inlined
+tiny placeholder from generate_placeholders.py. The page then shows
+complete markup before any script runs, and its script only toggles bios and opens
+profiles. Re-run after editing the configs or regenerating avatars.
+"""
+
+import argparse
+import html
+import re
+import sys
+from pathlib import Path
+
+from roster import SPEAKERS_CONFIG, load_config, load_organizers, load_speakers, parse_js_config
+from site_data import ATLAS_FILE, DISPLAY_SIZES, PLACEHOLDERS_FILE, RESPONSIVE_FILE
+
+# Configuration
+PAGE = "index.html"
+INDENT = "          "  # Indentation of the cards inside their container
+
+# Inline styles per roster: (photo <img> fallback, sprite <div>)
+AVATAR_STYLES = {
+    "speakers": (
+        "width:100px;height:100px;border-radius:50%;object-fit:cover;border:3px solid var(--accent);"
+        "margin-bottom:1rem;box-shadow:0 4px 16px rgba(250,178,43,.3);",
+        "border-radius:50%;margin-bottom:1rem;box-shadow:0 4px 16px rgba(250,178,43,.3);",
+    ),
+    "organizers": (
+        "width:120px;height:120px;border-radius:50%;object-fit:cover;border:4px solid var(--accent);"
+        "margin-bottom:1rem;box-shadow:0 4px 16px rgba(250,178,43,.3);",
+        "border-radius:50%;margin-bottom:1rem;box-shadow:0 4px 16px rgba(250,178,43,.3);",
+    ),
+}
+
+URL_PATTERN = re.compile(r"(https?://[^\s]+|www\.[^\s]+)")
+TALK_PATTERN = re.compile(
+    r'(<div class="talk-content">\s*)<div class="talk-title">.*?</div>(\s*)'
+    r'<div class="talk-speaker">.*?</div>(\s*)<div class="talk-abstract">.*?</div>',
+    re.DOTALL,
+)
+
+
+def escape(text):
+    return html.escape(text, quote=True)
+
+
+def load_generated(path, name):
+    """A generated JS data file (avatar atlas, srcset data, placeholders), or None if it has not been generated."""
+    try:
+        return parse_js_config(Path(path).read_text(encoding="utf-8"), name)
+    except (OSError, ValueError):
+        print(f"! {path} not found - run its generator for a faster page")
+        return None
+
+
+def photo_markup(src, alt, size, style, responsive, placeholder=None):
+    """<img>, wrapped in a <picture> with WebP/AVIF sources when derivatives exist."""
+    if placeholder:
+        # Blurred preview painted behind the photo until it loads
+        style += f"background:{placeholder['color']} url({placeholder['dataUri']}) center/cover no-repeat;"
+    img = (f'<img src="{escape(src)}" alt="{escape(alt)}" width="{size}" height="{size}" decoding="async" '
+           f'style="{style}" onerror="this.style.display=\'none\'">')
+    data = (responsive or {}).get(src)
+    if not data:
+        return img
+    sources = "".join(f'<source type="image/{fmt}" srcset="{escape(srcset)}" sizes="{size}px">'
+                      for fmt, srcset in data["srcset"].items())
+    return f"<picture>{sources}{img}</picture>"
+
+
+def avatar_markup(roster, person_id, src, alt, size, atlas, responsive, placeholder=None):
+    """Sprite from the avatar atlas when it was packed at this size, else the photo."""
+    photo_style, sprite_style = AVATAR_STYLES[roster]
+    sprite = atlas[roster].get(person_id) if atlas else None
+    if not sprite or sprite["size"] != size:
+        return photo_markup(src, alt, size, photo_style, responsive, placeholder)
+    # Sheets in preference order; browsers without image-set() type() keep the last format's 1x sheet
+    sheets = atlas["sheets"]
+    fallback = list(sheets.values())[-1]["1x"]
+    candidates = ", ".join(f"url({path}) type('image/{fmt}') {density}"
+                           for fmt, by_density in sheets.items() for density, path in by_density.items())
+    # The placeholder is a second background layer under the sprite sheet
+    under, under_size, under_position = "", "", ""
+    if placeholder:
+        under, under_size, under_position = f",url({placeholder['dataUri']})", ",cover", ",center"
+    background = (f"background-image:url({fallback}){under};"
+                  f"background-image:image-set({candidates}){under};"
+                  f"background-size:{atlas['width']}px {atlas['height']}px{under_size};"
+                  f"background-position:-{sprite['x']}px -{sprite['y']}px{under_position};"
+                  "background-repeat:no-repeat;")
+    return (f'<div role="img" aria-label="{escape(alt)}" '
+            f'style="width:{size}px;height:{size}px;flex:none;{background}{sprite_style}"></div>')
+
+
+def linkify(text):
+    """Escape text and turn URLs (http, https, www) into links."""
+    def link(match):
+        url = match.group(0)
+        href = url if not url.startswith("www.") else f"https://{url}"
+        return (f'<a href="{href}" target="_blank" rel="noopener" '
+                f'style="color:var(--accent-2);text-decoration:underline;">{url}</a>')
+    return URL_PATTERN.sub(link, html.escape(text, quote=False))
+
+
+def person_card(roster, person_id, person, atlas, responsive, placeholders):
+    """One speaker or organizer card; the page script adds the bio toggle and profile link behaviour."""
+    kind, prefix = ("speaker", "") if roster == "speakers" else ("organizer", "org-")
+    linkedin = person.get("linkedin", "#")
+    link_attrs = f' data-linkedin="{escape(linkedin)}" style="cursor:pointer;"' if linkedin != "#" else ""
+    bio = linkify(person.get("bio", "")) if roster == "organizers" else html.escape(person.get("bio", ""), quote=False)
+    avatar = avatar_markup(roster, person_id, person["image"], person["name"], DISPLAY_SIZES[roster],
+                           atlas, responsive, (placeholders or {}).get(person["image"]))
+    lines = [
+        f'<div class="{kind}"{link_attrs}>',
+        f'  <button class="expand-btn" id="{prefix}btn-{person_id}" data-bio="{prefix}bio-{person_id}">+</button>',
+        f"  {avatar}",
+        f"  <strong>{escape(person['name'])}</strong>",
+        f'  <div class="title">{escape(person.get("title", ""))}</div>',
+        f'  <div class="aff">{escape(person.get("affiliation", ""))}</div>',
+        f'  <div class="{kind}-bio" id="{prefix}bio-{person_id}">{bio}</div>',
+        "</div>",
+    ]
+    return "\n".join(INDENT + line for line in lines)
+
+
+def replace_section(page, name, body):
+    """Replace the markup between <!-- prerender:name --> and <!-- /prerender:name -->."""
+    start, end = f"<!-- prerender:{name} -->", f"<!-- /prerender:{name} -->"
+    pattern = re.compile(rf"{start}.*?{end}", re.DOTALL)
+    if not pattern.search(page):
+        raise ValueError(f"{PAGE} has no {start} markers")
+    return pattern.sub(lambda match: f"{start}\n{body}\n{INDENT}{end}", page, count=1)
+
+
+def fill_schedule(page, speakers, talk_order):
+    """Fill the talk rows, in order, from talkOrder. Rows without a known speaker are left as they are."""
+    rows = iter(talk_order)
+
+    def talk(match):
+        speaker_id = next(rows, None)
+        speaker = speakers.get(speaker_id)
+        if speaker is None:
+            if speaker_id is not None:
+                print(f"✗ talkOrder entry {speaker_id!r} is not in {SPEAKERS_CONFIG} - row left unchanged")
+            return match.group(0)
+        abstract = speaker.get("abstract") or "Abstract coming soon"
+        return (f'{match.group(1)}<div class="talk-title">{escape(speaker["title"])}</div>{match.group(2)}'
+                f'<div class="talk-speaker">{escape(speaker["name"])} — {escape(speaker["affiliation"])}</div>'
+                f'{match.group(3)}<div class="talk-abstract">{escape(abstract)}</div>')
+
+    return TALK_PATTERN.sub(talk, page)
+
+
+def prerender(page):
+    """Return page with the speaker, organizer and schedule markup rebuilt from the configs."""
+    speakers = load_speakers()
+    organizers = load_organizers()
+    talk_order = load_config(SPEAKERS_CONFIG, "talkOrder")
+    atlas = load_generated(ATLAS_FILE, "avatarAtlas")
+    responsive = load_generated(RESPONSIVE_FILE, "responsiveImages")
+    placeholders = load_generated(PLACEHOLDERS_FILE, "photoPlaceholders")
+
+    page = replace_section(page, "speakers", "\n".join(
+        person_card("speakers", person_id, person, atlas, responsive, placeholders)
+        for person_id, person in speakers.items()))
+    page = replace_section(page, "organizers", "\n".join(
+        person_card("organizers", person_id, person, atlas, responsive, placeholders)
+        for person_id, person in organizers.items()))
+    return fill_schedule(page, speakers, talk_order)
+
+
+def main(argv=None):
+    """Rewrite index.html with prerendered speaker, organizer and schedule markup."""
+    parser = argparse.ArgumentParser(description="Prerender the speaker, organizer and schedule sections of index.html.")
+    parser.add_argument("--check", action="store_true",
+                        help="only report whether index.html is up to date (exit status 1 if not)")
+    args = parser.parse_args(argv)
+
+    page_path = Path(PAGE)
+    current = page_path.read_text(encoding="utf-8")
+    rendered = prerender(current)
+    if args.check:
+        if rendered != current:
+            print(f"✗ {PAGE} is out of date - run prerender.py")
+            sys.exit(1)
+        print(f"✓ {PAGE} is up to date")
+        return
+
+    if rendered == current:
+        print(f"✓ {PAGE} already up to date")
+        return
+    page_path.write_text(rendered, encoding="utf-8")
+    print(f"✓ Prerendered {PAGE}")
+
+
+if __name__ == "__main__":
+    main()
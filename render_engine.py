@@ -0,0 +1,383 @@
+#!/usr/bin/env python3
+"""
+Single-pass render engine for Deep Matters: Foundations conference images.
+Decodes and center-crops each source photo once, then renders the circular avatar,
+the landscape (1200x627) and square (1080x1080) LinkedIn cards and the story (1080x1920)
+and X/Twitter (1600x900) cards from one resize pyramid of that square.
+Without --jobs, photos are decoded ahead and outputs written on background threads.
+With --watch, it keeps running and re-renders only the outputs whose inputs changed.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+import card_layouts
+import generate_linkedin_images as landscape
+import generate_linkedin_images_square as square
+import generate_organizer_avatars as organizer_avatars
+import generate_speaker_avatars as speaker_avatars
+from batch import add_jobs_argument, print_failure_summary
+from build_cache import (add_cache_arguments, find_stale_outputs, is_fresh, load_manifest,
+                         output_key, report_stale, save_manifest)
+from encoding import (add_encoding_arguments, format_stats, output_suffix, print_encoding_summary, save_image,
+                      settings_from_args)
+from fonts import describe_fonts
+from memory import estimate_cost, print_peak_memory
+from photo_utils import PhotoPyramid, add_crop_cache_arguments, configure_crop_cache, load_square_photo
+from pipeline import add_pipeline_arguments, run_stages
+from preflight import run_preflight
+from roster import ORGANIZERS_CONFIG, SPEAKERS_CONFIG, load_organizers, load_speakers
+from tracing import add_profile_argument, finish_profile, span, start_profile
+from watch import add_watch_arguments, snapshot, wait_for_changes
+
+
+def render_speaker_avatar(person_id, person, photo):
+    return speaker_avatars.create_circular_avatar(
+        photo,
+        size=speaker_avatars.AVATAR_SIZE,
+        border_width=speaker_avatars.BORDER_WIDTH,
+        border_color=speaker_avatars.COLOR_ACCENT
+    )
+
+
+def render_organizer_avatar(person_id, person, photo):
+    return speaker_avatars.create_circular_avatar(
+        photo,
+        size=organizer_avatars.AVATAR_SIZE,
+        border_width=organizer_avatars.BORDER_WIDTH,
+        border_color=organizer_avatars.COLOR_ACCENT
+    )
+
+
+def render_landscape_card(person_id, person, photo):
+    return landscape.generate_speaker_image(person_id, person, photo=photo)
+
+
+def render_square_card(person_id, person, photo):
+    return square.generate_speaker_image(person_id, person, photo=photo)
+
+
+def render_story_card(person_id, person, photo):
+    return card_layouts.render_card("story", person_id, person, photo=photo)
+
+
+def render_twitter_card(person_id, person, photo):
+    return card_layouts.render_card("twitter", person_id, person, photo=photo)
+
+
+# Layout-only formats (see card_layouts.LAYOUTS) go here
+SOCIAL_OUTPUT_DIR = "social_images"
+
+# Config file behind each roster, watched in --watch mode
+ROSTER_CONFIGS = {
+    "speakers": SPEAKERS_CONFIG,
+    "organizers": ORGANIZERS_CONFIG,
+}
+
+# Output formats: which roster each one covers, which generator owns it, where it goes,
+# the largest photo size it needs, the output canvas size and how it is drawn
+FORMATS = {
+    "speaker-avatar": {
+        "roster": "speakers",
+        "module": speaker_avatars,
+        "output_dir": speaker_avatars.OUTPUT_DIR,
+        "suffix": speaker_avatars.OUTPUT_SUFFIX,
+        "photo_size": speaker_avatars.AVATAR_SIZE - 2 * speaker_avatars.BORDER_WIDTH,
+        "canvas": (speaker_avatars.AVATAR_SIZE, speaker_avatars.AVATAR_SIZE),
+        "render": render_speaker_avatar,
+    },
+    "organizer-avatar": {
+        "roster": "organizers",
+        "module": organizer_avatars,
+        "output_dir": organizer_avatars.OUTPUT_DIR,
+        "suffix": organizer_avatars.OUTPUT_SUFFIX,
+        "photo_size": organizer_avatars.AVATAR_SIZE - 2 * organizer_avatars.BORDER_WIDTH,
+        "canvas": (organizer_avatars.AVATAR_SIZE, organizer_avatars.AVATAR_SIZE),
+        "render": render_organizer_avatar,
+    },
+    "linkedin": {
+        "roster": "speakers",
+        "module": landscape,
+        "output_dir": landscape.OUTPUT_DIR,
+        "suffix": landscape.OUTPUT_SUFFIX,
+        "photo_size": landscape.PHOTO_SIZE,
+        "canvas": card_layouts.LAYOUTS[landscape.LAYOUT]["size"],
+        "render": render_landscape_card,
+    },
+    "linkedin-square": {
+        "roster": "speakers",
+        "module": square,
+        "output_dir": square.OUTPUT_DIR,
+        "suffix": square.OUTPUT_SUFFIX,
+        "photo_size": square.PHOTO_SIZE,
+        "canvas": card_layouts.LAYOUTS[square.LAYOUT]["size"],
+        "render": render_square_card,
+    },
+    "story": {
+        "roster": "speakers",
+        "module": card_layouts,
+        "output_dir": SOCIAL_OUTPUT_DIR,
+        "suffix": "-story.png",
+        "photo_size": card_layouts.photo_slot_size("story"),
+        "canvas": card_layouts.LAYOUTS["story"]["size"],
+        "render": render_story_card,
+    },
+    "twitter": {
+        "roster": "speakers",
+        "module": card_layouts,
+        "output_dir": SOCIAL_OUTPUT_DIR,
+        "suffix": "-twitter.png",
+        "photo_size": card_layouts.photo_slot_size("twitter"),
+        "canvas": card_layouts.LAYOUTS["twitter"]["size"],
+        "render": render_twitter_card,
+    },
+}
+
+
+def load_rosters():
+    """Load the speaker and organizer rosters from the JS configs."""
+    return {"speakers": load_speakers(), "organizers": load_organizers()}
+
+
+def build_roster(rosters, formats=FORMATS):
+    """Combine every format's roster into one {image_path: [(format, person_id, data), ...]} map.
+
+    Outputs are grouped by photo, not by id: a speaker and an organizer with the same id
+    but different images each get their own photo.
+    """
+    roster = {}
+    for format_name, spec in formats.items():
+        for person_id, person in rosters[spec["roster"]].items():
+            roster.setdefault(person["image"], []).append((format_name, person_id, person))
+    return roster
+
+
+def people_in(entries):
+    """Ids of the people whose outputs a roster entry renders, for progress and failure messages."""
+    return ", ".join(dict.fromkeys(person_id for _, person_id, _ in entries))
+
+
+def output_file_for(format_name, person_id, settings, formats=FORMATS):
+    spec = formats[format_name]
+    return Path(spec["output_dir"]) / f"{person_id}{output_suffix(spec['suffix'], settings)}"
+
+
+def decode_photo(subject, image_path, entries, settings, formats=FORMATS):
+    """Decode one photo at the smallest JPEG draft scale that covers every requested format,
+    as a resize pyramid that serves each format's photo slot from its nearest level."""
+    sizes = [formats[format_name]["photo_size"] for format_name, _, _ in entries]
+    return PhotoPyramid(load_square_photo(image_path, min_size=max(sizes)), min_size=min(sizes))
+
+
+def render_images(photo, entries, settings, formats=FORMATS, decode_error=None):
+    """Render every requested format from one decoded photo.
+
+    Returns [(format, path, image or None, error)]; a decode error fails every format.
+    """
+    rendered = []
+    for format_name, person_id, person in entries:
+        output_file = output_file_for(format_name, person_id, settings, formats)
+        if decode_error is not None:
+            rendered.append((format_name, output_file, None, decode_error))
+            continue
+        try:
+            with span(format_name):
+                rendered.append((format_name, output_file, formats[format_name]["render"](person_id, person, photo), None))
+        except Exception as e:
+            rendered.append((format_name, output_file, None, e))
+    return rendered
+
+
+def write_images(rendered, settings):
+    """Encode and write rendered images. Returns [(format, path, (encode seconds, bytes) or None, error)]."""
+    results = []
+    for format_name, output_file, img, error in rendered:
+        if error is None:
+            try:
+                results.append((format_name, output_file, save_image(img, output_file, settings), None))
+                continue
+            except Exception as e:
+                error = e
+        results.append((format_name, output_file, None, error))
+    return results
+
+
+def render_person(subject, image_path, entries, settings, formats=FORMATS):
+    """Decode one photo and render every requested format from it (runs in a worker with --jobs).
+
+    Returns [(format, path, (encode seconds, bytes) or None, error)].
+    """
+    with span("render", subject=subject):
+        try:
+            photo, decode_error = decode_photo(subject, image_path, entries, settings, formats), None
+        except Exception as e:
+            photo, decode_error = None, e
+        # Write each format before rendering the next, so only one output canvas is held at a time
+        results = []
+        for entry in entries:
+            results += write_images(render_images(photo, [entry], settings, formats, decode_error), settings)
+        return results
+
+
+def estimate_person_cost(subject, image_path, entries, settings, formats=FORMATS):
+    """Estimated peak bytes of one render_person task, from the photo's header (for --max-memory)."""
+    sizes = [formats[format_name]["photo_size"] for format_name, _, _ in entries]
+    return estimate_cost(image_path, max(sizes), [formats[format_name]["canvas"] for format_name, _, _ in entries])
+
+
+def render_people(tasks, args):
+    """Yield (results, error) per render_person task, in task order."""
+    return run_stages(
+        tasks, args, render_person,
+        load=decode_photo,
+        render=lambda task, photo, error: render_images(photo, task[2], task[3], decode_error=error),
+        write=lambda task, rendered: write_images(rendered, task[3]),
+        subject=lambda task: task[0],
+        cost=estimate_person_cost,
+    )
+
+
+def dependency_index(roster, settings, formats=FORMATS):
+    """Map every watched input (photo, logos, fonts, roster config) to the output files that depend on it.
+
+    Generator source files are left out: code changes need a restart to take effect.
+    """
+    index = {}
+    for entries in roster.values():
+        for format_name, person_id, person in entries:
+            spec = formats[format_name]
+            output_file = str(output_file_for(format_name, person_id, settings, formats))
+            inputs = [path for path in spec["module"].render_inputs(person) if path and not path.endswith(".py")]
+            inputs.append(ROSTER_CONFIGS[spec["roster"]])
+            for path in inputs:
+                index.setdefault(path, set()).add(output_file)
+    return index
+
+
+def render_pass(args, settings, only=None):
+    """Render every output whose cache key changed (restricted to the output paths in only, if given).
+
+    Returns the combined roster the pass was built from.
+    """
+    roster = build_roster(load_rosters())
+    total = sum(len(entries) for entries in roster.values())
+    print(f"Rendering {total} images from {len(roster)} photos ({len(FORMATS)} formats)...")
+
+    # Only decode photos that have at least one output whose inputs changed
+    manifest = load_manifest()
+    keys = {}
+    tasks = []
+    considered = 0
+    skipped = 0
+    for image_path, entries in roster.items():
+        pending = []
+        for format_name, person_id, person in entries:
+            output_file = output_file_for(format_name, person_id, settings)
+            if only is not None and str(output_file) not in only:
+                continue
+            considered += 1
+            module = FORMATS[format_name]["module"]
+            key = output_key(module, person, module.render_inputs(person), settings)
+            keys[str(output_file)] = key
+            if not args.force and is_fresh(manifest, output_file, key):
+                skipped += 1
+            else:
+                pending.append((format_name, person_id, person))
+        if pending:
+            tasks.append((people_in(pending), image_path, pending, settings))
+
+    generated = 0
+    failures = []
+    all_stats = []
+    for (subject, _, _, _), (results, error) in zip(tasks, render_people(tasks, args)):
+        if error is not None:
+            failures.append((subject, error))
+            continue
+        for format_name, output_file, stats, error in results:
+            if error is None:
+                generated += 1
+                manifest[str(output_file)] = keys[str(output_file)]
+                all_stats.append(stats)
+                print(f"✓ Generated: {output_file} {format_stats(stats)}")
+            else:
+                failures.append((f"{subject} ({format_name})", error))
+
+    for format_name, spec in FORMATS.items():
+        expected = [output_file_for(format_name, person_id, settings)
+                    for entries in roster.values() for name, person_id, _ in entries if name == format_name]
+        suffix = output_suffix(spec["suffix"], settings)
+        report_stale(find_stale_outputs(spec["output_dir"], suffix, expected), manifest, prune=args.prune)
+    save_manifest(manifest)
+
+    print_encoding_summary(all_stats, settings)
+    print_failure_summary(failures)
+    scope = "images" if only is None else f"affected images of {total}"
+    print(f"\nDone! Generated {generated}/{considered} {scope} ({skipped} unchanged, skipped), decoding each photo once.")
+    return roster
+
+
+def watch_loop(args, settings, roster, since):
+    """Re-render the outputs that depend on each debounced batch of changed inputs, until interrupted.
+
+    since is the snapshot of the watched inputs taken before the first pass.
+    """
+    # Later passes only re-render what changed, even when the first one was --force
+    args.force = False
+    configs = set(ROSTER_CONFIGS.values())
+    while True:
+        index = dependency_index(roster, settings)
+        print(f"\nWatching {len(index)} inputs for changes (Ctrl+C to stop)...")
+        changed = wait_for_changes(sorted(index), args.poll_interval, args.debounce, since)
+        if changed & configs:
+            # People may have been added or renamed: let the cache keys pick what to render
+            affected = None
+            print(f"\nChanged: {', '.join(sorted(changed))} -> rebuilding the roster")
+        else:
+            affected = set().union(*(index[path] for path in changed))
+            print(f"\nChanged: {', '.join(sorted(changed))} -> {len(affected)} affected outputs")
+        # Snapshot before rendering, so edits made during the pass trigger the next one
+        since = snapshot(sorted(index))
+        roster = render_pass(args, settings, only=affected)
+
+
+def main(argv=None):
+    """Render every avatar and card for the combined roster in a single pass."""
+    parser = argparse.ArgumentParser(description="Render all avatars and LinkedIn cards in one pass.")
+    add_cache_arguments(parser)
+    add_crop_cache_arguments(parser)
+    add_jobs_argument(parser)
+    add_pipeline_arguments(parser)
+    add_profile_argument(parser)
+    add_encoding_arguments(parser)
+    add_watch_arguments(parser)
+    parser.add_argument("--skip-preflight", action="store_true",
+                        help="start rendering without first checking every photo and logo header")
+    args = parser.parse_args(argv)
+    start_profile(args)
+    configure_crop_cache(args)
+    settings = settings_from_args(parser, args)
+
+    for spec in FORMATS.values():
+        Path(spec["output_dir"]).mkdir(exist_ok=True)
+
+    for line in describe_fonts():
+        print(f"Font: {line}")
+    # Fail fast on missing, unreadable or mis-cased inputs instead of halfway through the batch
+    if not args.skip_preflight and not run_preflight(FORMATS):
+        print("\nFix the errors above or re-run with --skip-preflight.")
+        sys.exit(1)
+    since = snapshot(sorted(dependency_index(build_roster(load_rosters()), settings))) if args.watch else None
+    roster = render_pass(args, settings)
+
+    if args.watch:
+        try:
+            watch_loop(args, settings, roster, since)
+        except KeyboardInterrupt:
+            print("\nStopped watching.")
+
+    print_peak_memory(args)
+    finish_profile(args)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+// Responsive photo derivatives, generated by generate_responsive_images.py - do not edit
+const responsiveImages = {
+  "images/hassan-sirelkhatim.jpeg": {
+    "src": "images/hassan-sirelkhatim.jpeg",
+    "widths": [
+      100,
+      200
+    ],
+    "srcset": {
+      "avif": "responsive_images/hassan-sirelkhatim-100w.avif 100w, responsive_images/hassan-sirelkhatim-200w.avif 200w",
+      "webp": "responsive_images/hassan-sirelkhatim-100w.webp 100w, responsive_images/hassan-sirelkhatim-200w.webp 200w"
+    }
+  },
+  "images/peter-coveney.jpg": {
+    "src": "images/peter-coveney.jpg",
+    "widths": [
+      100,
+      200,
+      300
+    ],
+    "srcset": {
+      "avif": "responsive_images/peter-coveney-100w.avif 100w, responsive_images/peter-coveney-200w.avif 200w, responsive_images/peter-coveney-300w.avif 300w",
+      "webp": "responsive_images/peter-coveney-100w.webp 100w, responsive_images/peter-coveney-200w.webp 200w, responsive_images/peter-coveney-300w.webp 300w"
+    }
+  },
+  "images/james-gin.jpg": {
+    "src": "images/james-gin.jpg",
+    "widths": [
+      100,
+      200,
+      300
+    ],
+    "srcset": {
+      "avif": "responsive_images/james-gin-100w.avif 100w, responsive_images/james-gin-200w.avif 200w, responsive_images/james-gin-300w.avif 300w",
+      "webp": "responsive_images/james-gin-100w.webp 100w, responsive_images/james-gin-200w.webp 200w, responsive_images/james-gin-300w.webp 300w"
+    }
+  },
+  "images/francesco-ferroni.jpg": {
+    "src": "images/francesco-ferroni.jpg",
+    "widths": [
+      100,
+      200
+    ],
+    "srcset": {
+      "avif": "responsive_images/francesco-ferroni-100w.avif 100w, responsive_images/francesco-ferroni-200w.avif 200w",
+      "webp": "responsive_images/francesco-ferroni-100w.webp 100w, responsive_images/francesco-ferroni-200w.webp 200w"
+    }
+  },
+  "images/steven-kench.jpg": {
+    "src": "images/steven-kench.jpg",
+    "widths": [
+      100,
+      200,
+      300
+    ],
+    "srcset": {
+      "avif": "responsive_images/steven-kench-100w.avif 100w, responsive_images/steven-kench-200w.avif 200w, responsive_images/steven-kench-300w.avif 300w",
+      "webp": "responsive_images/steven-kench-100w.webp 100w, responsive_images/steven-kench-200w.webp 200w, responsive_images/steven-kench-300w.webp 300w"
+    }
+  },
+  "images/sina-samangooei.jpg": {
+    "src": "images/sina-samangooei.jpg",
+    "widths": [
+      100,
+      200,
+      300
+    ],
+    "srcset": {
+      "avif": "responsive_images/sina-samangooei-100w.avif 100w, responsive_images/sina-samangooei-200w.avif 200w, responsive_images/sina-samangooei-300w.avif 300w",
+      "webp": "responsive_images/sina-samangooei-100w.webp 100w, responsive_images/sina-samangooei-200w.webp 200w, responsive_images/sina-samangooei-300w.webp 300w"
+    }
+  },
+  "images/lei-ge.JPG": {
+    "src": "images/lei-ge.JPG",
+    "widths": [
+      100,
+      120,
+      200,
+      240,
+      300,
+      360
+    ],
+    "srcset": {
+      "avif": "responsive_images/lei-ge-100w.avif 100w, responsive_images/lei-ge-120w.avif 120w, responsive_images/lei-ge-200w.avif 200w, responsive_images/lei-ge-240w.avif 240w, responsive_images/lei-ge-300w.avif 300w, responsive_images/lei-ge-360w.avif 360w",
+      "webp": "responsive_images/lei-ge-100w.webp 100w, responsive_images/lei-ge-120w.webp 120w, responsive_images/lei-ge-200w.webp 200w, responsive_images/lei-ge-240w.webp 240w, responsive_images/lei-ge-300w.webp 300w, responsive_images/lei-ge-360w.webp 360w"
+    }
+  },
+  "images/ronan-docherty.jpg": {
+    "src": "images/ronan-docherty.jpg",
+    "widths": [
+      100,
+      200,
+      300
+    ],
+    "srcset": {
+      "avif": "responsive_images/ronan-docherty-100w.avif 100w, responsive_images/ronan-docherty-200w.avif 200w, responsive_images/ronan-docherty-300w.avif 300w",
+      "webp": "responsive_images/ronan-docherty-100w.webp 100w, responsive_images/ronan-docherty-200w.webp 200w, responsive_images/ronan-docherty-300w.webp 300w"
+    }
+  },
+  "images/samuel-cooper.jpg": {
+    "src": "images/samuel-cooper.jpg",
+    "widths": [
+      120,
+      240,
+      360
+    ],
+    "srcset": {
+      "avif": "responsive_images/samuel-cooper-120w.avif 120w, responsive_images/samuel-cooper-240w.avif 240w, responsive_images/samuel-cooper-360w.avif 360w",
+      "webp": "responsive_images/samuel-cooper-120w.webp 120w, responsive_images/samuel-cooper-240w.webp 240w, responsive_images/samuel-cooper-360w.webp 360w"
+    }
+  }
+};
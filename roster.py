@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Load the speaker and organizer rosters straight from speakers-config.js and
+organizers-config.js, so the generators never drift from what the website shows.
+Parsed configs are cached in .build_cache/ keyed on file mtime and content hash.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+# Configuration
+SPEAKERS_CONFIG = "speakers-config.js"
+ORGANIZERS_CONFIG = "organizers-config.js"
+CACHE_DIR = ".build_cache"
+MANIFEST_FILE = "roster-manifest.json"
+
+# Affiliation logos used on the LinkedIn cards (a "logo" field in the JS config wins)
+AFFILIATION_LOGOS = {
+    "Polaron": "images/polaron-logo.png",
+    "Imperial College London": "images/imperial-logo.png",
+}
+
+
+_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "b": "\b", "f": "\f", "v": "\v", "0": "\0"}
+
+
+class _JSLiteralParser:
+    """Minimal parser for the JS object/array literals used in the config files."""
+
+    def __init__(self, text, pos=0):
+        self.text = text
+        self.pos = pos
+
+    def error(self, message):
+        line = self.text.count("\n", 0, self.pos) + 1
+        raise ValueError(f"{message} at line {line}")
+
+    def skip_ws(self):
+        text = self.text
+        while self.pos < len(text):
+            if text[self.pos].isspace():
+                self.pos += 1
+            elif text.startswith("//", self.pos):
+                end = text.find("\n", self.pos)
+                self.pos = len(text) if end == -1 else end
+            elif text.startswith("/*", self.pos):
+                end = text.find("*/", self.pos + 2)
+                if end == -1:
+                    self.error("Unterminated comment")
+                self.pos = end + 2
+            else:
+                break
+
+    def peek(self):
+        self.skip_ws()
+        return self.text[self.pos] if self.pos < len(self.text) else ""
+
+    def expect(self, char):
+        if self.peek() != char:
+            self.error(f"Expected {char!r}")
+        self.pos += 1
+
+    def value(self):
+        char = self.peek()
+        if char == "{":
+            return self.object()
+        if char == "[":
+            return self.array()
+        if char in "\"'":
+            return self.string()
+        if char == "`":
+            self.error("Template literals are not supported")
+        word = self.word()
+        literals = {"true": True, "false": False, "null": None}
+        if word in literals:
+            return literals[word]
+        try:
+            return float(word) if any(c in word for c in ".eE") else int(word)
+        except ValueError:
+            self.error(f"Unsupported value {word!r}")
+
+    def word(self):
+        self.skip_ws()
+        start = self.pos
+        while self.pos < len(self.text) and (self.text[self.pos].isalnum() or self.text[self.pos] in "_$.+-"):
+            self.pos += 1
+        if start == self.pos:
+            self.error("Unexpected character")
+        return self.text[start:self.pos]
+
+    def string(self):
+        quote = self.text[self.pos]
+        self.pos += 1
+        chars = []
+        while True:
+            if self.pos >= len(self.text):
+                self.error("Unterminated string")
+            char = self.text[self.pos]
+            if char == quote:
+                self.pos += 1
+                return "".join(chars)
+            if char == "\\":
+                escape = self.text[self.pos + 1:self.pos + 2]
+                if escape == "u":
+                    chars.append(chr(int(self.text[self.pos + 2:self.pos + 6], 16)))
+                    self.pos += 6
+                else:
+                    chars.append(_ESCAPES.get(escape, escape))
+                    self.pos += 2
+                continue
+            chars.append(char)
+            self.pos += 1
+
+    def object(self):
+        self.expect("{")
+        result = {}
+        while self.peek() != "}":
+            key = self.string() if self.peek() in "\"'" else self.word()
+            self.expect(":")
+            result[key] = self.value()
+            if self.peek() == ",":
+                self.pos += 1
+            elif self.peek() != "}":
+                self.error("Expected ',' or '}'")
+        self.pos += 1
+        return result
+
+    def array(self):
+        self.expect("[")
+        result = []
+        while self.peek() != "]":
+            result.append(self.value())
+            if self.peek() == ",":
+                self.pos += 1
+            elif self.peek() != "]":
+                self.error("Expected ',' or ']'")
+        self.pos += 1
+        return result
+
+
+def parse_js_config(text, name):
+    """Extract the literal assigned to `const <name> = ...` from JS source."""
+    for keyword in ("const", "let", "var"):
+        marker = f"{keyword} {name}"
+        start = text.find(marker)
+        if start != -1:
+            equals = text.find("=", start + len(marker))
+            return _JSLiteralParser(text, equals + 1).value()
+    raise ValueError(f"{name} not found")
+
+
+def _file_hash(path):
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+def _load_manifest(manifest_path):
+    try:
+        return json.loads(manifest_path.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def load_config(path, name, cache_dir=CACHE_DIR):
+    """Parse a JS config, reusing the cached result if the file's mtime or hash is unchanged."""
+    manifest_path = Path(cache_dir) / MANIFEST_FILE
+    manifest = _load_manifest(manifest_path)
+    key = f"{path}:{name}"
+    entry = manifest.get(key)
+    stat = os.stat(path)
+
+    if entry and entry["mtime"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+        return entry["data"]
+
+    digest = _file_hash(path)
+    if entry and entry["sha256"] == digest:
+        data = entry["data"]
+    else:
+        data = parse_js_config(Path(path).read_text(encoding="utf-8"), name)
+
+    manifest[key] = {"mtime": stat.st_mtime_ns, "size": stat.st_size, "sha256": digest, "data": data}
+    try:
+        manifest_path.parent.mkdir(exist_ok=True)
+        # Written atomically, so concurrent generators never read a half-written cache
+        tmp_path = manifest_path.with_name(f"{manifest_path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(manifest, indent=2, ensure_ascii=False))
+        os.replace(tmp_path, manifest_path)
+    except OSError as e:
+        print(f"Could not write roster cache: {e}")
+    return data
+
+
+def _with_logo(person):
+    person = dict(person)
+    person.setdefault("logo", AFFILIATION_LOGOS.get(person.get("affiliation")))
+    return person
+
+
+def load_speakers(path=SPEAKERS_CONFIG):
+    """Return {speaker_id: speaker_data} from speakers-config.js, in config order."""
+    return {speaker_id: _with_logo(data) for speaker_id, data in load_config(path, "speakersConfig").items()}
+
+
+def load_organizers(path=ORGANIZERS_CONFIG):
+    """Return {organizer_id: organizer_data} from organizers-config.js, in config order."""
+    return {organizer_id: _with_logo(data) for organizer_id, data in load_config(path, "organizersConfig").items()}
+
+
+def main():
+    """Print a summary of the parsed rosters."""
+    speakers = load_speakers()
+    organizers = load_organizers()
+    print(f"{len(speakers)} speakers from {SPEAKERS_CONFIG}:")
+    for speaker_id, speaker in speakers.items():
+        print(f"  {speaker_id}: {speaker['name']} ({speaker.get('affiliation', '')}) - {speaker['image']}")
+    print(f"{len(organizers)} organizers from {ORGANIZERS_CONFIG}:")
+    for organizer_id, organizer in organizers.items():
+        print(f"  {organizer_id}: {organizer['name']} - {organizer['image']}")
+
+
+if __name__ == "__main__":
+    main()
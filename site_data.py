@@ -0,0 +1,17 @@
+#!/usr/bin/env python3
+"""
+Names of the generated JS data files and the photo sizes the website shows.
+Shared by the generators that write the files and by prerender.py, which only reads
+them, so this module must stay free of Pillow, NumPy and import-time work.
+"""
+
+# Configuration
+ATLAS_FILE = "avatar-atlas.js"
+PLACEHOLDERS_FILE = "photo-placeholders.js"
+RESPONSIVE_FILE = "responsive-images.js"
+
+# Card photo sizes in CSS pixels, matching the <img> styles in index.html
+DISPLAY_SIZES = {
+    "speakers": 100,
+    "organizers": 120,
+}
@@ -0,0 +1,150 @@
+"""
+Tests for the shared avatar and card compositing routine (masks.composite_shaped_photo).
+
+Outputs are compared with previous_shaped_photo below, the compositing it replaced
+(a separate RGBA photo layer, putalpha, then a masked paste onto a copy of the border
+shape), and the Pillow images allocated per avatar and per card are counted.
+
+    python -m pytest tests
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+from PIL import Image
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+import card_layouts
+import generate_speaker_avatars as speaker_avatars
+from benchmarks.bench_generators import synthetic_photo
+from masks import shape_mask
+from photo_utils import photo_at
+
+AVATAR_SIZE = 400
+BORDER_WIDTH = 8
+PHOTO_SIZE = 1024
+
+# No affiliation logo, so a card's only allocations are its own
+SPEAKER = {
+    "name": "Ada Lovelace",
+    "affiliation": "Analytical Engine Society",
+    "image": "images/missing.jpg",
+    "logo": None,
+}
+
+
+def previous_shaped_photo(photo, shape, border, border_color, radius=0, border_radius=0):
+    """The compositing composite_shaped_photo replaced, as an RGBA image."""
+    size = photo.width
+    layer = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+    layer.paste(photo, (0, 0))
+    layer.putalpha(shape_mask(shape, size, radius))
+
+    outer = size + 2 * border
+    bordered = Image.new("RGBA", (outer, outer), border_color)
+    bordered.putalpha(shape_mask(shape, outer, border_radius))
+    bordered.paste(layer, (border, border), layer)
+    return bordered
+
+
+def seam(canvas_size, shape, size, radius, xy):
+    """Boolean (h, w) array of the photo's anti-aliased edge pixels placed at xy on a canvas.
+
+    The previous compositing blended the alpha band with itself there, leaving the
+    edge between photo and border partly transparent; it is now opaque.
+    """
+    edge = np.asarray(shape_mask(shape, size, radius))
+    result = np.zeros((canvas_size[1], canvas_size[0]), dtype=bool)
+    x, y = xy
+    result[y:y + size, x:x + size] = (edge > 0) & (edge < 255)
+    return result
+
+
+@pytest.fixture(autouse=True)
+def repo_root(monkeypatch):
+    """The generators resolve configs, fonts and logos relative to the repository root."""
+    monkeypatch.chdir(REPO_ROOT)
+
+
+@pytest.fixture(scope="module")
+def photo():
+    return synthetic_photo((PHOTO_SIZE, PHOTO_SIZE))
+
+
+@pytest.fixture
+def allocations(monkeypatch):
+    """Counts of Image.new, Image.copy and Image.convert calls while the test runs."""
+    counts = {"new": 0, "copy": 0, "convert": 0}
+
+    def counting(name, func):
+        def wrapper(*args, **kwargs):
+            counts[name] += 1
+            return func(*args, **kwargs)
+        return wrapper
+
+    monkeypatch.setattr(Image, "new", counting("new", Image.new))
+    monkeypatch.setattr(Image.Image, "copy", counting("copy", Image.Image.copy))
+    monkeypatch.setattr(Image.Image, "convert", counting("convert", Image.Image.convert))
+    return counts
+
+
+def test_avatar_matches_previous_compositing(photo):
+    inner_size = AVATAR_SIZE - 2 * BORDER_WIDTH
+    avatar = speaker_avatars.create_circular_avatar(photo, AVATAR_SIZE, BORDER_WIDTH, speaker_avatars.COLOR_ACCENT)
+    previous = previous_shaped_photo(photo_at(photo, inner_size), "circle", BORDER_WIDTH,
+                                     speaker_avatars.COLOR_ACCENT)
+
+    assert avatar.mode == "RGBA" and avatar.size == (AVATAR_SIZE, AVATAR_SIZE)
+    new, old = np.asarray(avatar), np.asarray(previous)
+    edge = seam(avatar.size, "circle", inner_size, 0, (BORDER_WIDTH, BORDER_WIDTH))
+    assert (new[..., :3] == old[..., :3]).all()
+    assert (new[~edge] == old[~edge]).all()
+    assert (new[edge][:, 3] == 255).all()
+
+
+@pytest.mark.parametrize("layout_name", sorted(card_layouts.LAYOUTS))
+def test_card_matches_previous_compositing(monkeypatch, photo, layout_name):
+    card = card_layouts.render_card(layout_name, "ada-lovelace", SPEAKER, photo=photo)
+
+    placed = []
+
+    def previous(source, slot, canvas=None, xy=(0, 0)):
+        layer = previous_shaped_photo(photo_at(source, slot["size"]), slot["shape"], slot["border"],
+                                      card_layouts.COLOR_ACCENT, slot.get("radius", 0), slot.get("border_radius", 0))
+        canvas.paste(layer, xy, layer)
+        placed.append(xy)
+        return canvas
+
+    monkeypatch.setattr(card_layouts, "shaped_photo", previous)
+    previous_card = card_layouts.render_card(layout_name, "ada-lovelace", SPEAKER, photo=photo)
+
+    slot = card_layouts.LAYOUTS[layout_name]["photo"]
+    (x, y), = placed
+    edge = seam(card.size, slot["shape"], slot["size"], slot.get("radius", 0),
+                (x + slot["border"], y + slot["border"]))
+    new, old = np.asarray(card), np.asarray(previous_card)
+    assert card.size == previous_card.size
+    assert (new[~edge] == old[~edge]).all()
+
+
+def test_avatar_allocates_only_its_output(photo, allocations):
+    # Warm the mask cache, so only per-avatar work is counted
+    speaker_avatars.create_circular_avatar(photo, AVATAR_SIZE, BORDER_WIDTH)
+    allocations.update(dict.fromkeys(allocations, 0))
+
+    speaker_avatars.create_circular_avatar(photo, AVATAR_SIZE, BORDER_WIDTH)
+    assert allocations == {"new": 1, "copy": 0, "convert": 0}
+
+
+@pytest.mark.parametrize("layout_name", sorted(card_layouts.LAYOUTS))
+def test_card_allocates_only_its_template_copy(photo, allocations, layout_name):
+    # Warm the template and mask caches, so only per-card work is counted
+    card_layouts.render_card(layout_name, "ada-lovelace", SPEAKER, photo=photo)
+    allocations.update(dict.fromkeys(allocations, 0))
+
+    card_layouts.render_card(layout_name, "ada-lovelace", SPEAKER, photo=photo)
+    assert allocations == {"new": 0, "copy": 1, "convert": 0}
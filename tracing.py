@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Span tracing for the Deep Matters image generators (--profile).
+Stages record spans (decode, crop, resize, composite, draw.text, logo load,
+encode/write) tagged with the speaker being rendered. The trace is written as
+Chrome/Perfetto JSON (open it in ui.perfetto.dev or chrome://tracing) and a
+top-N table points at the slowest stages and speakers. When profiling is off,
+span() is a shared no-op context.
+"""
+
+import contextlib
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+
+# Off unless a generator is run with --profile
+ENABLED = False
+
+# Recorded Chrome trace events ("X" complete events, timestamps in microseconds)
+EVENTS = []
+
+DEFAULT_TRACE_FILE = "profile-trace.json"
+TOP_N = 10
+
+_NULL_SPAN = contextlib.nullcontext()
+_local = threading.local()
+
+
+def enable():
+    global ENABLED
+    ENABLED = True
+
+
+def add_profile_argument(parser):
+    """Add the shared --profile option to a generator's argument parser."""
+    parser.add_argument("--profile", nargs="?", const=DEFAULT_TRACE_FILE, metavar="TRACE_FILE",
+                        help=f"record per-speaker stage spans and write a Chrome/Perfetto trace "
+                             f"(default file: {DEFAULT_TRACE_FILE})")
+
+
+def start_profile(args):
+    """Turn tracing on when --profile was given."""
+    if args.profile:
+        enable()
+
+
+def _subjects():
+    if not hasattr(_local, "subjects"):
+        _local.subjects = []
+    return _local.subjects
+
+
+@contextlib.contextmanager
+def _record(name, subject, args):
+    subjects = _subjects()
+    if subject is not None:
+        subjects.append(subject)
+    start = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        end = time.perf_counter_ns()
+        if subjects:
+            args["subject"] = subjects[-1]
+        if subject is not None:
+            subjects.pop()
+        EVENTS.append({
+            "name": name,
+            "cat": "render",
+            "ph": "X",
+            "ts": start / 1000,
+            "dur": (end - start) / 1000,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+            "args": args,
+        })
+
+
+def span(name, subject=None, **args):
+    """Context manager timing one stage; subject (e.g. a speaker id) tags it and every nested span."""
+    if not ENABLED:
+        return _NULL_SPAN
+    return _record(name, subject, args)
+
+
+def collect(func, *args):
+    """Run func(*args) with tracing on and return (result, events); used in worker processes."""
+    enable()
+    EVENTS.clear()  # forked workers inherit the parent's events
+    result = func(*args)
+    return result, list(EVENTS)
+
+
+def write_trace(path):
+    """Write the recorded events as a Chrome/Perfetto JSON trace."""
+    trace = {"traceEvents": EVENTS, "displayTimeUnit": "ms"}
+    Path(path).write_text(json.dumps(trace), encoding="utf-8")
+
+
+def print_summary(top=TOP_N):
+    """Print the stages with the most total time and the slowest individual spans."""
+    if not EVENTS:
+        return
+    totals = defaultdict(list)
+    for event in EVENTS:
+        totals[event["name"]].append(event)
+
+    print(f"\nTop {top} stages by total time:")
+    print(f"  {'stage':<16} {'count':>6} {'total ms':>10} {'mean ms':>9} {'max ms':>9}  slowest")
+    ranked = sorted(totals.items(), key=lambda item: -sum(event["dur"] for event in item[1]))
+    for name, events in ranked[:top]:
+        durations = [event["dur"] / 1000 for event in events]
+        slowest = max(events, key=lambda event: event["dur"])
+        print(f"  {name:<16} {len(events):>6} {sum(durations):>10.1f} {sum(durations) / len(durations):>9.2f} "
+              f"{max(durations):>9.2f}  {slowest['args'].get('subject', '-')}")
+
+    print(f"\nTop {top} slowest spans:")
+    for event in sorted(EVENTS, key=lambda event: -event["dur"])[:top]:
+        details = ", ".join(f"{key}={value}" for key, value in event["args"].items() if key != "subject")
+        print(f"  {event['dur'] / 1000:>9.2f} ms  {event['name']:<16} {event['args'].get('subject', '-')}"
+              + (f"  ({details})" if details else ""))
+
+
+def finish_profile(args):
+    """Write the trace and print the summary when --profile was given."""
+    if not args.profile:
+        return
+    write_trace(args.profile)
+    print_summary()
+    print(f"\nTrace with {len(EVENTS)} spans written to {args.profile} (open in ui.perfetto.dev)")
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+File watching for --watch mode of the Deep Matters image generators.
+Inputs are polled by mtime and size (no extra dependencies, works on network
+mounts), and a burst of edits is debounced into a single change set so that
+saving several photos at once triggers one re-render.
+"""
+
+import os
+import time
+
+# Configuration
+POLL_INTERVAL = 0.5  # Seconds between mtime checks
+DEBOUNCE = 1.0  # Seconds without further changes before re-rendering
+
+
+def add_watch_arguments(parser):
+    """Add the shared --watch options to a generator's argument parser."""
+    parser.add_argument("--watch", action="store_true",
+                        help="keep running and re-render outputs whose photos, logos, configs or fonts change")
+    parser.add_argument("--poll-interval", type=float, default=POLL_INTERVAL, metavar="SECONDS",
+                        help=f"how often to check inputs in --watch mode (default: {POLL_INTERVAL})")
+    parser.add_argument("--debounce", type=float, default=DEBOUNCE, metavar="SECONDS",
+                        help=f"quiet period before re-rendering a burst of edits (default: {DEBOUNCE})")
+
+
+def file_state(path):
+    """(mtime ns, size) of a file, or None if it is missing."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def snapshot(paths):
+    return {path: file_state(path) for path in paths}
+
+
+def changed_paths(before, after):
+    """Paths whose state differs between two snapshots (including files that appeared or vanished)."""
+    return {path for path in before.keys() | after.keys() if before.get(path) != after.get(path)}
+
+
+def wait_for_changes(paths, poll_interval=POLL_INTERVAL, debounce=DEBOUNCE, since=None):
+    """Block until some of paths change, then until they stay quiet for debounce seconds.
+
+    since is an earlier snapshot (taken before a render pass), so edits made while the pass
+    ran are picked up too; paths it does not cover start from their current state.
+    Returns the set of changed paths.
+    """
+    baseline = snapshot(paths)
+    if since:
+        baseline.update((path, state) for path, state in since.items() if path in baseline)
+    changed = set()
+    last_change = None
+    while True:
+        time.sleep(poll_interval)
+        current = snapshot(paths)
+        newly_changed = changed_paths(baseline, current)
+        if newly_changed:
+            changed |= newly_changed
+            baseline = current
+            last_change = time.monotonic()
+        elif changed and time.monotonic() - last_change >= debounce:
+            return changed